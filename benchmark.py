@@ -0,0 +1,291 @@
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from hypercube import topology
+from hypercube.afterimage import MotionTrails
+from hypercube.engine import HypercubeEngine
+from hypercube.raster import PixelRasterizer
+from hypercube.render import Renderer
+from hypercube.transform import Transform, all_planes
+from hypercube.ui import Slider, SliderPanel
+
+# Per-stage timings of the frame pipeline, for the original pure-Python code
+# ("legacy", as in the first versions of rotating_*.py) and the current one.
+# Results are written as JSON so runs can be compared between commits.
+
+
+# Legacy implementations, kept here only as a baseline
+
+def legacy_rotation_matrices(dim, planes, angles):
+    matrices = []
+    for (a, b), angle in zip(planes, angles):
+        m = [[1 if i == j else 0 for j in range(dim)] for i in range(dim)]
+        m[a][a] = math.cos(angle)
+        m[a][b] = -math.sin(angle)
+        m[b][a] = math.sin(angle)
+        m[b][b] = math.cos(angle)
+        matrices.append(m)
+    return matrices
+
+
+def legacy_multiply_matrix(a, b):
+    result = [0] * len(a)
+    for i in range(len(a)):
+        sum_val = 0
+        for j in range(len(a[0])):
+            sum_val += a[i][j] * b[j]
+        result[i] = sum_val
+    return result
+
+
+def legacy_transform(points, matrices):
+    rotated_points = []
+    for point in points:
+        rotated = point
+        for m in matrices:
+            rotated = legacy_multiply_matrix(m, rotated)
+        rotated_points.append(rotated)
+    return rotated_points
+
+
+def legacy_project(points, dim, distances, scale, offset_x, offset_y):
+    projected = []
+    for point in points:
+        p = point
+        for k, distance in zip(range(dim, 2, -1), distances):
+            w = 1 / (distance - p[k - 1])
+            projection = [[w if i == j else 0 for j in range(k)] for i in range(k - 1)]
+            p = legacy_multiply_matrix(projection, p)
+        projected.append((int(p[0] * scale) + offset_x, int(p[1] * scale) + offset_y))
+    return projected
+
+
+def legacy_edges(points, dim):
+    edges = []
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            diff_count = 0
+            for k in range(dim):
+                if points[i][k] != points[j][k]:
+                    diff_count += 1
+            if diff_count == 1:
+                edges.append((i, j))
+    return edges
+
+
+def legacy_draw(screen, points, edges):
+    for point in points:
+        pygame.draw.circle(screen, (255, 255, 255), point, 3)
+    for i, j in edges:
+        pygame.draw.line(screen, (100, 255, 100), points[i], points[j], 1)
+
+
+def legacy_slider_draw(screen, slider, font):
+    label = font.render(f"{slider.text}: {slider.val:.3f}", True, (255, 255, 255))
+    screen.blit(label, (slider.rect.x, slider.rect.y - 25))
+    pygame.draw.rect(screen, (100, 100, 100), slider.rect)
+    pygame.draw.rect(screen, (200, 200, 200), slider.knob_rect())
+    pygame.draw.rect(screen, (150, 50, 50), slider.reset_rect)
+    reset_label = font.render("R", True, (255, 255, 255))
+    screen.blit(reset_label, reset_label.get_rect(center=slider.reset_rect.center))
+
+
+# Timing harness
+
+def measure(func, min_time, max_runs=100000):
+    # Repeat until min_time has elapsed; report per-call statistics
+    samples = []
+    total = 0.0
+    while total < min_time and len(samples) < max_runs:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        total += elapsed
+    samples = np.array(samples) * 1e6
+    return {
+        "runs": len(samples),
+        "mean_us": float(samples.mean()),
+        "median_us": float(np.median(samples)),
+        "min_us": float(samples.min()),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_dimension(dim, screen, min_time, legacy):
+    engine = HypercubeEngine(dim)
+    planes = all_planes(dim)
+    transform = Transform(dim, planes)
+    angles = np.linspace(0.1, 0.7, len(planes))
+    offset_x, offset_y = screen.get_width() // 2, screen.get_height() // 2
+    renderer = Renderer(screen, (0, 0, 0), display=False)
+    rasterizer = PixelRasterizer(screen)
+    additive = PixelRasterizer(screen, additive=True)
+
+    matrix = transform.matrix(angles)
+    rotated = transform.apply(engine.points, matrix)
+    projected = engine.project(rotated)
+    # Every perspective step shrinks the figure, so fit it to the screen height
+    scale = 250 / np.abs(projected).max()
+    points = engine.to_screen(projected, scale, offset_x, offset_y)
+
+    # A full ring of 64 positions along a slow rotation, for the trail pass
+    trails = MotionTrails(screen, len(engine.points), 64)
+    trails.history[:] = [
+        engine.to_screen(engine.project(transform.apply(engine.points, transform.matrix(angles * step / 64).copy())),
+                         scale, offset_x, offset_y)
+        for step in range(64)
+    ]
+    trails.count = 64
+
+    def build_uncached():
+        for cached in (topology.edges, topology.trails, topology.vertices):
+            cached.cache_clear()
+        topology.trails(dim)
+
+    # Drawing only; clearing the surface is the same for both paths
+    def draw_vectorized():
+        renderer.draw_figure(points, engine.trails, (100, 255, 100), 1, (255, 255, 255), 3)
+
+    stages = [
+        ("matrix", "vectorized", lambda: transform.matrix(angles)),
+        ("transform", "vectorized", lambda: transform.apply(engine.points, matrix)),
+        ("projection", "vectorized",
+         lambda: engine.to_screen(engine.project(rotated), scale, offset_x, offset_y)),
+        ("edges", "topology-cached", lambda: topology.edges(dim)),
+        ("edges", "topology-build", build_uncached),
+        ("draw", "batched", draw_vectorized),
+        ("draw", "raster", lambda: rasterizer.draw(points, engine.edges, (100, 255, 100), (255, 255, 255), 3)),
+        ("draw", "raster-additive",
+         lambda: additive.draw(points, engine.edges, (20, 60, 20), (255, 255, 255), 3)),
+        ("draw", "trails-64", lambda: trails.draw((90, 140, 255), (0, 0, 0))),
+    ]
+
+    if legacy:
+        legacy_points = engine.points.tolist()
+        legacy_matrices = legacy_rotation_matrices(dim, planes, angles.tolist())
+        legacy_rotated = legacy_transform(legacy_points, legacy_matrices)
+        legacy_screen = [tuple(p) for p in points.tolist()]
+        legacy_edge_list = [tuple(e) for e in engine.edges.tolist()]
+
+        def draw_legacy():
+            legacy_draw(screen, legacy_screen, legacy_edge_list)
+
+        stages += [
+            ("matrix", "legacy", lambda: legacy_rotation_matrices(dim, planes, angles.tolist())),
+            ("transform", "legacy", lambda: legacy_transform(legacy_points, legacy_matrices)),
+            ("projection", "legacy",
+             lambda: legacy_project(legacy_rotated, dim, engine.distances, scale, offset_x, offset_y)),
+            ("edges", "legacy", lambda: legacy_edges(legacy_points, dim)),
+            ("draw", "legacy", draw_legacy),
+        ]
+
+    results = []
+    for stage, impl, func in stages:
+        result = measure(func, min_time)
+        result.update(stage=stage, impl=impl, dim=dim, vertices=len(engine.points),
+                      edges=len(engine.edges))
+        results.append(result)
+    return results
+
+
+def bench_sliders(screen, min_time):
+    def make_sliders():
+        return [Slider(50, 50 + 50 * i, 200, 10, -0.1, 0.1, 0.0, f"Speed {i}", 0) for i in range(6)]
+
+    legacy_sliders = make_sliders()
+    font = pygame.font.Font(None, 24)
+
+    def draw_legacy():
+        for slider in legacy_sliders:
+            legacy_slider_draw(screen, slider, font)
+
+    sliders = make_sliders()
+    panel = SliderPanel(sliders, (0, 0, 0))
+    panel.update()
+
+    def draw_idle():
+        panel.draw(screen, [panel.rect.copy()])
+        panel.update()
+
+    tick = [0]
+
+    def draw_dragging():
+        # One slider moves every frame, as while dragging
+        tick[0] += 1
+        sliders[0].val = (tick[0] % 200 - 100) / 1000
+        panel.update()
+        panel.draw(screen, [sliders[0].area])
+
+    results = []
+    for impl, func in [("legacy", draw_legacy), ("panel-idle", draw_idle),
+                       ("panel-dragging", draw_dragging)]:
+        result = measure(func, min_time)
+        result.update(stage="sliders", impl=impl, dim=None, vertices=None, edges=None)
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hypercube frame pipeline stages")
+    parser.add_argument("--dims", type=int, nargs="+", default=[3, 4, 6, 8, 10])
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds spent timing each stage")
+    parser.add_argument("--max-legacy-dim", type=int, default=8,
+                        help="skip the pure-Python baseline above this dimension")
+    parser.add_argument("--json", help="write results to this file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.Surface((1000, 600))
+
+    results = []
+    for dim in args.dims:
+        results += bench_dimension(dim, screen, args.min_time, dim <= args.max_legacy_dim)
+    results += bench_sliders(screen, args.min_time)
+    pygame.quit()
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "results": results,
+    }
+
+    table = sys.stderr if args.json == "-" else sys.stdout
+    print(f"{'stage':<11}{'impl':<17}{'dim':>4}{'median us':>12}{'min us':>12}", file=table)
+    for r in results:
+        dim = "" if r["dim"] is None else r["dim"]
+        print(f"{r['stage']:<11}{r['impl']:<17}{dim:>4}{r['median_us']:>12.1f}{r['min_us']:>12.1f}",
+              file=table)
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
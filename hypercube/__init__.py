@@ -0,0 +1,4 @@
+import os
+
+# Keep stdout clean for headless frame streams ("--output -")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
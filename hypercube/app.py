@@ -0,0 +1,340 @@
+import os
+import sys
+import time
+
+import pygame
+
+from .engine import HypercubeEngine
+from .orientation import Orientation
+from .pipeline import FramePipeline
+from .quality import DEFAULT_LEVEL, QUALITY_LEVELS, QualityGovernor
+from .render import Renderer
+from .scheduler import FrameScheduler
+from .transform import Transform
+from .ui import SliderPanel
+
+
+class HypercubeApp:
+    # Subclasses describe the figure; the loop below is shared by every dimension.
+    # Optional extras (filled faces, cross-section, profiler, rasterizer, trails,
+    # recording) are imported when first enabled, so startup only loads what the
+    # first frame needs. The pipelined worker lives in the core pipeline module
+    # and only starts its thread when enabled.
+    dim = 3
+    planes = []  # (axis_a, axis_b) per speed slider, in the order they are applied
+    caption = "Rotating Hypercube"
+    background = (0, 0, 0)
+    vertex_color = (255, 255, 255)
+    vertex_radius = 3
+    edge_color = (100, 255, 100)
+    edge_width = 1
+    face_color = (100, 255, 100)
+    outline_color = (255, 255, 255)  # edges drawn over filled faces
+    trail_color = (90, 140, 255)  # vertex afterimages, faded towards the background
+    trail_length = 64
+    # Filled faces, cross-section, trails, rasterizer and the pipelined worker
+    # all go through the single figure drawn by draw(); False for apps that
+    # draw their own way (MultiViewApp), which then reject those options
+    single_view = True
+
+    def __init__(self, headless=False, mesh=None):
+        self.headless = headless
+        if headless:
+            # No window: SDL still needs a video driver for fonts and surfaces
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        self.width = 1000
+        self.height = 600
+        if headless:
+            self.screen = pygame.Surface((self.width, self.height))
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            pygame.display.set_caption(self.caption)
+        self.scheduler = FrameScheduler(60)
+        self.renderer = Renderer(self.screen, self.background, display=not headless)
+
+        self.engine = HypercubeEngine(self.dim, mesh)
+        self.figure = mesh.source if mesh is not None else None  # None: the app's own hypercube
+        # Filled faces (F key) need hypercube cells, so not for loaded meshes
+        self.fillable = mesh is None
+        self.shader = None  # built by enable_solid
+        self.solid = False
+        # Hyperplane cross-section (S key), driven by a slider after Scale when the app has one
+        self.sliceable = mesh is None
+        self.section = None  # built by enable_section
+        self.sectioning = False
+        self.transform = Transform(self.dim, self.planes)
+        self.orientation = Orientation(self.transform)
+        self.pipeline = FramePipeline(self.engine, self.orientation, self.transform)
+        self.pipelined = None  # wireframe transformed on a worker thread, off (None) by default
+        self.drawn = None  # inputs of the figure on screen, to skip redrawing it unchanged
+        self.running = True
+
+        # Offset center of drawing to right side to not overlap sliders
+        self.offset_x = self.width // 2 + 100
+        self.offset_y = self.height // 2
+
+        # One speed slider per plane, then scale
+        self.sliders = self.create_sliders()
+        self.panel = SliderPanel(self.sliders, self.background)
+
+        # Frame-time instrumentation, off (None) unless requested or toggled with F3
+        self.profiler = None
+        self.profile_path = None
+        self.overlay = None
+        self.show_overlay = False
+
+        # Adaptive quality, off (None) unless enabled; without it every frame is "normal"
+        self.governor = None
+        self.frame_count = 0
+
+        # Wireframe through the array rasterizer instead of pygame.draw, off (None) by default
+        self.rasterizer = None
+
+        # Fading afterimage of the vertex positions (T key), off (None) by default
+        self.trails = None
+
+        # Input trace being recorded for replay.replay, off (None) by default
+        self.recorder = None
+        self.record_path = None
+
+    def create_sliders(self):
+        raise NotImplementedError
+
+    def enable_profiler(self, path=None):
+        if self.profiler is None:
+            from .profiler import FrameProfiler
+            self.profiler = FrameProfiler()
+        if path is not None:
+            self.profile_path = path
+
+    def enable_governor(self, target_fps=60):
+        self.governor = QualityGovernor(target_fps)
+
+    def enable_rasterizer(self, additive=False):
+        from .raster import PixelRasterizer
+        self.rasterizer = PixelRasterizer(self.screen, additive)
+
+    def enable_solid(self):
+        if self.shader is None:
+            from .solid import SolidShader
+            self.shader = SolidShader(self.engine, self.face_color)
+            self.pipeline.shader = self.shader
+        self.solid = True
+
+    def enable_section(self):
+        if self.section is None:
+            from .section import CrossSection
+            self.section = CrossSection(self.dim)
+            self.pipeline.cross_section = self.section
+        self.sectioning = True
+
+    def enable_pipelining(self):
+        from .pipeline import PipelinedWireframe
+        self.pipelined = PipelinedWireframe(self.engine, self.orientation, self.transform)
+
+    def enable_trails(self, length=None):
+        from .afterimage import MotionTrails
+        self.trails = MotionTrails(self.screen, len(self.engine.points), length or self.trail_length)
+
+    def enable_recording(self, path):
+        # Starts from the current slider values, so call after setting them
+        from .replay import Recorder
+        self.recorder = Recorder(self)
+        self.record_path = path
+
+    def finish(self):
+        if self.pipelined is not None:
+            self.pipelined.close()
+        if self.profiler is not None and self.profile_path:
+            self.profiler.dump(self.profile_path)
+        if self.recorder is not None:
+            self.recorder.save(self.record_path)
+
+    def run(self):
+        while self.running:
+            self.scheduler.wait()
+            self.frame()
+        self.finish()
+        pygame.quit()
+
+    def frame(self):
+        # One paced iteration: input, the simulation steps owed for the real
+        # time elapsed, and a render unless the scheduler says we are behind
+        prof = self.profiler
+        if prof is not None:
+            prof.mark("tick")
+        start = time.perf_counter()
+        steps = self.scheduler.steps()
+        render = self.scheduler.should_render()
+        events = pygame.event.get()
+        if self.recorder is not None:
+            self.recorder.add(steps, render, events)
+        self.handle_events(events)
+        if prof is not None:
+            prof.mark("events")
+        self.step(steps, render)
+        if render:
+            self.govern(start)
+        return self.running
+
+    def govern(self, start):
+        # Busy time only: the scheduler's wait is not part of the cost
+        if self.governor is not None and self.governor.record(time.perf_counter() - start):
+            self.quality_changed()
+
+    def quality_changed(self):
+        settings = self.governor.settings
+        print(f"quality: {settings['name']} ({self.governor.reason})", file=sys.stderr)
+        if not self.headless:
+            pygame.display.set_caption(f"{self.caption} [{settings['name']}]")
+
+    def step(self, steps=1, render=True):
+        # Advance the simulation by fixed steps and render, without pacing or
+        # input. Returns whether a new frame was presented.
+        prof = self.profiler
+        self.update(steps)
+        if prof is not None:
+            prof.mark("update")
+        presented = render and self.draw()
+        if presented:
+            self.present()
+            if prof is not None:
+                prof.mark("display")
+        if prof is not None:
+            prof.end()
+        return presented
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # Covered or restored window: dirty rects no longer describe it, repaint everything
+                self.renderer.previous = None
+                self.drawn = None
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.running = False
+                if event.key == pygame.K_F3:
+                    self.toggle_overlay()
+                if event.key == pygame.K_f and self.can_fill():
+                    if self.solid:
+                        self.solid = False
+                    else:
+                        self.enable_solid()
+                if event.key == pygame.K_s and self.can_section():
+                    if self.sectioning:
+                        self.sectioning = False
+                    else:
+                        self.enable_section()
+                if event.key == pygame.K_t and self.single_view:
+                    if self.trails is None:
+                        self.enable_trails()
+                    else:
+                        self.trails = None
+
+            self.panel.handle_event(event)
+
+    def can_fill(self):
+        return self.fillable
+
+    def can_section(self):
+        return self.sliceable and len(self.sliders) > len(self.planes) + 1
+
+    def update(self, steps=1):
+        # Speed sliders are in radians per second
+        speeds = [slider.val * self.scheduler.dt for slider in self.sliders[:len(self.planes)]]
+        self.orientation.set_speeds(speeds)
+        self.orientation.step(steps)
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.enable_profiler()
+            if self.overlay is None:
+                from .profiler import ProfilerOverlay
+                font = pygame.font.Font(None, 18)
+                self.overlay = ProfilerOverlay(self.profiler, font, (10, self.height - 140))
+        elif self.overlay.rect is not None:
+            self.renderer.clear_area(self.overlay.rect)
+            self.overlay.rect = None
+
+    def present(self):
+        self.renderer.present()
+
+    def draw(self):
+        # Returns False when nothing on screen changed, so there is nothing to present
+        prof = self.profiler
+        quality = self.governor.settings if self.governor is not None else QUALITY_LEVELS[DEFAULT_LEVEL]
+        self.frame_count += 1
+
+        # Only sliders whose value or drag state moved need to be pushed
+        changed = []
+        if self.frame_count % quality["slider_every"] == 0:
+            changed = self.panel.update()
+        if prof is not None:
+            prof.mark("sliders")
+
+        # Each stage reruns only if its inputs changed since the last frame
+        scale = self.sliders[len(self.planes)].val
+        if self.sectioning:
+            offset = self.sliders[len(self.planes) + 1].val
+            stage = self.pipeline.section(offset, scale, self.offset_x, self.offset_y)
+        elif self.solid:
+            stage = self.pipeline.solid(scale, self.offset_x, self.offset_y)
+        elif self.pipelined is not None:
+            stage = self.pipelined.wireframe(scale, self.offset_x, self.offset_y)
+        else:
+            stage = self.pipeline.wireframe(scale, self.offset_x, self.offset_y)
+        if prof is not None:
+            prof.mark("transform")
+
+        key = (stage, stage.version, quality["name"], self.rasterizer is not None, self.trails is not None)
+        if (key == self.drawn and not changed and not self.renderer.dirty and not self.show_overlay
+                and self.renderer.previous is not None):
+            return False
+        self.drawn = key
+
+        self.renderer.clear()
+        if self.show_overlay and self.overlay.rect is not None:
+            self.renderer.clear_area(self.overlay.rect)
+        for area in changed:
+            self.renderer.clear_area(area)
+
+        if self.trails is not None and not (self.sectioning or self.solid):
+            # Under the figure, so the current positions stay on top
+            self.trails.update(stage)
+            self.renderer.draw_trails(self.trails, self.trail_color)
+        if self.sectioning:
+            points = stage.output
+            segments = self.pipeline.sliced.output[1]
+            # Nothing to draw when the hyperplane misses the figure
+            if len(points):
+                vertex_radius = self.vertex_radius if quality["dots"] else 0
+                self.renderer.draw_figure(points, segments, self.edge_color, quality["line_width"] or self.edge_width,
+                                          self.vertex_color, vertex_radius, quality["antialias"])
+        elif self.solid:
+            points, polygons, colors = stage.output
+            # Edges stay on top so the cells hidden behind the hull still read
+            self.renderer.draw_faces(polygons, colors)
+            self.renderer.draw_figure(points, self.engine.trails, self.outline_color, 1, self.vertex_color, 0,
+                                      quality["antialias"], quality["resolution"])
+        elif self.rasterizer is not None:
+            vertex_radius = self.vertex_radius if quality["dots"] else 0
+            self.renderer.draw_pixels(self.rasterizer, stage.output, self.engine.edges, self.edge_color,
+                                      self.vertex_color, vertex_radius)
+        else:
+            edge_width = quality["line_width"] or self.edge_width
+            vertex_radius = self.vertex_radius if quality["dots"] else 0
+            self.renderer.draw_figure(stage.output, self.engine.trails, self.edge_color, edge_width,
+                                      self.vertex_color, vertex_radius, quality["antialias"], quality["resolution"])
+        if prof is not None:
+            prof.mark("draw")
+
+        self.panel.draw(self.screen, self.renderer.touched())
+        if self.show_overlay:
+            self.renderer.mark_dirty(self.overlay.draw(self.screen))
+        if prof is not None:
+            prof.mark("sliders")
+        return True
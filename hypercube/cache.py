@@ -0,0 +1,44 @@
+import hashlib
+import os
+
+import numpy as np
+
+# On-disk cache of derived arrays (parsed meshes, generated polytopes) as
+# plain .npy files, so they can be reopened memory-mapped instead of rebuilt.
+CACHE_DIR = os.environ.get("HYPERCUBE_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "hypercube"))
+
+
+def file_key(path, *extra):
+    # Changes whenever the source file is replaced or modified
+    stat = os.stat(path)
+    text = "|".join(str(part) for part in (os.path.realpath(path), stat.st_size, stat.st_mtime_ns) + extra)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def load_arrays(key, names, cache_dir=None):
+    # Returns {name: read-only memory-mapped array}, or None on a cache miss
+    cache_dir = cache_dir or CACHE_DIR
+    arrays = {}
+    for name in names:
+        path = os.path.join(cache_dir, f"{key}.{name}.npy")
+        try:
+            arrays[name] = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+    return arrays
+
+
+def save_arrays(key, arrays, cache_dir=None):
+    cache_dir = cache_dir or CACHE_DIR
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name, array in arrays.items():
+            path = os.path.join(cache_dir, f"{key}.{name}.npy")
+            # Write then rename, so a reader never maps a half-written file
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp, path)
+    except OSError:
+        # A read-only or full cache directory only costs the speed-up
+        pass
@@ -0,0 +1,149 @@
+import argparse
+import sys
+
+import pygame
+
+from .headless import open_writer, render_frames
+from .mesh import load
+from .polytopes import POLYTOPES, polytope
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(app_class, argv=None):
+    parser = argparse.ArgumentParser(description=app_class.caption)
+    parser.add_argument("--headless", action="store_true",
+                        help="render offscreen without a window or frame cap")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="number of frames to render in headless mode")
+    parser.add_argument("--output", help="PNG directory, or raw RGB file ('-' for stdout)")
+    parser.add_argument("--format", choices=["png", "raw"], default="png")
+    parser.add_argument("--speeds", type=float, nargs="+",
+                        help="initial rotation speeds, one per speed slider in order")
+    parser.add_argument("--scale", type=float, help="initial scale")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="record per-stage frame times and dump them on exit (.json or .csv)")
+    figure = parser.add_mutually_exclusive_group()
+    figure.add_argument("--mesh", help="wireframe to rotate instead of the hypercube (.obj, .off, 4OFF, nOFF)")
+    figure.add_argument("--polytope", choices=sorted(POLYTOPES),
+                        help="regular 4D polytope to rotate instead of the tesseract")
+    parser.add_argument("--solid", action="store_true",
+                        help="start with filled, shaded faces (toggle with F)")
+    parser.add_argument("--section", action="store_true",
+                        help="start with the hyperplane cross-section (toggle with S)")
+    parser.add_argument("--trails", type=positive_int, nargs="?", const=app_class.trail_length, metavar="LENGTH",
+                        help="draw fading trails of the last LENGTH vertex positions (default %(const)s, toggle with T)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="step render quality down or up to hold 60 fps")
+    parser.add_argument("--raster", action="store_true",
+                        help="draw the wireframe with the NumPy pixel rasterizer")
+    parser.add_argument("--additive", action="store_true",
+                        help="rasterize with additive blending, so overlapping lines glow (implies --raster)")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="transform the next frame on a worker thread while this one is drawn")
+    parser.add_argument("--record", metavar="PATH",
+                        help="save the input trace of this session (.npz) on exit")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="replay a recorded input trace headless (frames via --output, timings via --profile)")
+    parser.add_argument("--serve", type=int, metavar="PORT",
+                        help="render headless and stream MJPEG over HTTP on this port (sliders via /set)")
+    parser.add_argument("--host", default="127.0.0.1", help="address to serve on (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if not app_class.single_view:
+        options = {"--solid": args.solid, "--section": args.section, "--trails": args.trails is not None,
+                   "--raster": args.raster, "--additive": args.additive, "--pipelined": args.pipelined}
+        for option, given in options.items():
+            if given:
+                parser.error(f"{option} is not supported by {app_class.__name__}, which draws several views")
+
+    mesh = None
+    if args.mesh:
+        try:
+            mesh = load(args.mesh).normalized()
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load {args.mesh}: {e}")
+        if mesh.dim != app_class.dim:
+            parser.error(f"{args.mesh} is {mesh.dim}D but this app rotates {app_class.dim}D figures")
+    elif args.polytope:
+        if app_class.dim != 4:
+            parser.error(f"{args.polytope} is 4D but this app rotates {app_class.dim}D figures")
+        mesh, timings = polytope(args.polytope)
+        steps = ", ".join(f"{step} {seconds * 1000:.1f} ms" for step, seconds in timings.items())
+        print(f"{args.polytope}: {len(mesh.points)} vertices, {len(mesh.edges)} edges ({steps})", file=sys.stderr)
+        mesh = mesh.normalized()
+
+    recording = None
+    if args.replay:
+        # Replay and the stream server are imported only when asked for, to keep startup short
+        from .replay import Recording, replay
+        try:
+            recording = Recording(args.replay)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read {args.replay}: {e}")
+        args.headless = True
+    if args.serve is not None:
+        args.headless = True
+    if args.record and args.headless:
+        # Only the windowed loop reads input, so a headless trace would be empty
+        parser.error("--record needs the window; it cannot be combined with --headless, --replay or --serve")
+
+    app = app_class(headless=args.headless, mesh=mesh)
+    planes = len(app.planes)
+    for slider, speed in zip(app.sliders[:planes], args.speeds or []):
+        slider.val = speed
+    if args.scale is not None:
+        app.sliders[planes].val = args.scale
+    if args.solid and app.can_fill():
+        app.enable_solid()
+    if args.section and app.can_section():
+        app.enable_section()
+    if args.profile:
+        app.enable_profiler(args.profile)
+    if args.pipelined:
+        app.enable_pipelining()
+    if args.trails is not None:
+        app.enable_trails(args.trails)
+    if args.raster or args.additive:
+        app.enable_rasterizer(args.additive)
+    if args.adaptive:
+        app.enable_governor()
+
+    if recording is not None:
+        try:
+            fps = replay(app, recording, open_writer(args.format, args.output))
+        except ValueError as e:
+            parser.error(f"cannot replay {args.replay}: {e}")
+        app.finish()
+        pygame.quit()
+        print(f"{len(recording)} recorded frames, {fps:.1f} frames/sec", file=sys.stderr)
+        return
+
+    if args.serve is not None:
+        from .stream import StreamServer
+        try:
+            server = StreamServer(app, args.host, args.serve)
+        except OSError as e:
+            parser.error(f"cannot serve on {args.host}:{args.serve}: {e}")
+        server.run()
+        app.finish()
+        pygame.quit()
+        print(f"{server.frames} frames streamed", file=sys.stderr)
+        return
+
+    if args.record:
+        app.enable_recording(args.record)
+    if not args.headless:
+        app.run()
+        return
+
+    fps = render_frames(app, args.frames, open_writer(args.format, args.output))
+    app.finish()
+    pygame.quit()
+    # stdout may be carrying the raw frames
+    print(f"{args.frames} frames, {fps:.1f} frames/sec", file=sys.stderr)
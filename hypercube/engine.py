@@ -0,0 +1,59 @@
+import math
+
+import numpy as np
+
+from . import topology
+
+# Viewer distance for each perspective step, keyed by the dimension being
+# projected away (3D -> 2D uses 4, 4D -> 3D uses 3, as in the original scripts)
+PROJECTION_DISTANCES = {3: 4, 4: 3}
+
+
+def projection_distance(dim):
+    if dim in PROJECTION_DISTANCES:
+        return PROJECTION_DISTANCES[dim]
+    # Keep the viewer outside the rotated figure, whose radius is sqrt(dim)
+    return math.sqrt(dim) + 1
+
+
+class HypercubeEngine:
+    def __init__(self, dim, mesh=None):
+        self.dim = dim
+
+        if mesh is None:
+            # Topology is built once per dimension and shared between instances
+            self.points = topology.vertices(dim)
+            self.edges = topology.edges(dim)
+            self.trails = topology.trails(dim)
+        else:
+            # Any wireframe of the same dimension goes through the same pipeline
+            self.points = mesh.points
+            self.edges = mesh.edges
+            self.trails = mesh.trails
+
+        # One perspective step per dimension above 2, outermost first
+        self.distances = [projection_distance(k) for k in range(dim, 2, -1)]
+
+    def project(self, rotated, target=2, distances=None):
+        # Perspective steps from the input's dimension down to target. Works on
+        # (V x D) or any stack of them, e.g. (instances x V x D). distances
+        # overrides the viewer distance per step (outermost first); a None
+        # step is orthographic and just drops the axis
+        if distances is None:
+            distances = self.distances
+        projected = rotated
+        for k in range(projected.shape[-1], target, -1):
+            distance = distances[self.dim - k]
+            if distance is None:
+                projected = projected[..., :k - 1]
+                continue
+            factor = 1 / (distance - projected[..., k - 1])
+            projected = projected[..., :k - 1] * factor[..., None]
+        return projected
+
+    def to_screen(self, projected, scale, offset_x, offset_y):
+        # Truncate like int() did, then shift to the drawing centre
+        screen = (projected * scale).astype(np.intp)
+        screen[..., 0] += offset_x
+        screen[..., 1] += offset_y
+        return screen
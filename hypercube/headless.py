@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+import pygame
+
+
+class PNGSequenceWriter:
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.count = 0
+
+    def write(self, surface):
+        pygame.image.save(surface, os.path.join(self.directory, f"frame_{self.count:05d}.png"))
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class RawRGBWriter:
+    # Concatenated width x height x 3 frames, to a file or "-" for stdout
+    def __init__(self, path):
+        if path == "-":
+            self.stream = sys.stdout.buffer
+            self.owned = False
+        else:
+            self.stream = open(path, "wb")
+            self.owned = True
+
+    def write(self, surface):
+        self.stream.write(pygame.image.tobytes(surface, "RGB"))
+
+    def close(self):
+        self.stream.flush()
+        if self.owned:
+            self.stream.close()
+
+
+def open_writer(fmt, path):
+    if path is None:
+        return None
+    if fmt == "png":
+        return PNGSequenceWriter(path)
+    return RawRGBWriter(path)
+
+
+def render_frames(app, frames, writer=None):
+    # Run the app as fast as possible with no frame cap; returns frames/sec
+    prof = app.profiler
+    start = time.perf_counter()
+    for _ in range(frames):
+        if prof is not None:
+            # Writing the previous frame is not part of the next one's update
+            prof.mark("tick")
+        app.step()
+        if writer is not None:
+            writer.write(app.screen)
+    elapsed = time.perf_counter() - start
+    if writer is not None:
+        writer.close()
+    return frames / elapsed if elapsed > 0 else float("inf")
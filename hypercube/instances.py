@@ -0,0 +1,89 @@
+import math
+import time
+
+import numpy as np
+import pygame
+
+from .engine import HypercubeEngine
+from .transform import Transform, all_planes
+
+
+class InstancedScene:
+    # Many copies of one figure, each with its own orientation, speed, scale
+    # and offset. Per-instance state lives in stacked arrays so the whole
+    # scene is rotated and projected as one (instances x V x D) computation.
+    def __init__(self, dim, count, width, height, seed=0, dt=1 / 60, renormalize_every=600):
+        self.engine = HypercubeEngine(dim)
+        self.dim = dim
+        self.count = count
+        self.renormalize_every = renormalize_every
+        self.steps = 0
+        rng = np.random.default_rng(seed)
+
+        # Random starting orientations (orthonormal via QR) and angular speeds
+        q, r = np.linalg.qr(rng.standard_normal((count, dim, dim)))
+        self.orientations = q * np.sign(np.diagonal(r, axis1=1, axis2=2))[:, None, :]
+        self.speeds = rng.uniform(-1.5, 1.5, (count, len(all_planes(dim))))
+        transform = Transform(dim, all_planes(dim))
+        self.deltas = np.stack([transform.matrix(speeds * dt).copy() for speeds in self.speeds])
+        self._scratch = np.empty_like(self.orientations)
+
+        # Grid layout filling the screen
+        columns = max(1, math.ceil(math.sqrt(count * width / height)))
+        rows = math.ceil(count / columns)
+        cell = min(width / columns, height / rows)
+        index = np.arange(count)
+        self.offsets = np.stack([(index % columns + 0.5) * cell,
+                                 (index // columns + 0.5) * cell], axis=1).astype(np.intp)
+        # Rough projected radius of the figure, so each one fills about its cell
+        extent = math.sqrt(dim) / math.prod(self.engine.distances)
+        self.scales = cell * 0.4 / extent * rng.uniform(0.8, 1.2, count)
+
+    def step(self, steps=1):
+        for _ in range(steps):
+            np.matmul(self.deltas, self.orientations, out=self._scratch)
+            self.orientations, self._scratch = self._scratch, self.orientations
+            self.steps += 1
+            if self.steps % self.renormalize_every == 0:
+                q, r = np.linalg.qr(self.orientations)
+                self.orientations[:] = q * np.sign(np.diagonal(r, axis1=1, axis2=2))[:, None, :]
+
+    def project(self):
+        # (N x V x D) rotated vertices in one batched product, then projected
+        rotated = np.matmul(self.engine.points, self.orientations.transpose(0, 2, 1))
+        projected = self.engine.project(rotated)
+        screen = (projected * self.scales[:, None, None]).astype(np.intp)
+        screen += self.offsets[:, None, :]
+        return screen
+
+    def draw(self, surface, points, color=(100, 255, 100)):
+        # One polyline call per instance (its Euler trail)
+        trail = self.engine.trails[0]
+        for polyline in points[:, trail].tolist():
+            pygame.draw.lines(surface, color, False, polyline, 1)
+
+
+def frame_time(dim, count, surface, frames=30):
+    # Mean seconds for step + project + draw of one frame, rendered offscreen
+    scene = InstancedScene(dim, count, surface.get_width(), surface.get_height())
+    start = time.perf_counter()
+    for _ in range(frames):
+        surface.fill((0, 0, 0))
+        scene.step()
+        scene.draw(surface, scene.project())
+    return (time.perf_counter() - start) / frames
+
+
+def max_instances(dim, surface, budget=1 / 60, limit=1 << 16):
+    # Largest instance count whose frame fits the budget: doubling, then bisection
+    low, high = 0, 1
+    while high <= limit and frame_time(dim, high, surface) <= budget:
+        low, high = high, high * 2
+    high = min(high, limit + 1)
+    while high - low > max(1, low // 20):
+        middle = (low + high) // 2
+        if frame_time(dim, middle, surface) <= budget:
+            low = middle
+        else:
+            high = middle
+    return low
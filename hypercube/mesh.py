@@ -0,0 +1,302 @@
+import mmap
+import os
+import warnings
+
+import numpy as np
+
+from . import cache, topology
+
+# Wireframe meshes from OBJ and OFF files (including the 4OFF and nOFF
+# variants for 4D and higher). Files are memory-mapped and tokenized a block
+# at a time with array operations: lines, tokens and numbers never become
+# individual Python objects. Parsed buffers are cached as .npy files and
+# reopened memory-mapped.
+
+BLOCK_SIZE = 1 << 24
+
+SPACE = ord(" ")
+NEWLINE = ord("\n")
+WHITESPACE = np.zeros(256, dtype=bool)
+WHITESPACE[[ord(c) for c in " \t\r\n\v\f"]] = True
+BLANK = WHITESPACE.copy()  # whitespace within a line
+BLANK[NEWLINE] = False
+
+
+class Mesh:
+    def __init__(self, points, edges, trails=None, source=None):
+        self.points = points
+        self.edges = edges
+        if trails is None:
+            trails = topology.edge_trails(edges, len(points))
+        self.trails = trails
+        self.source = source  # where the mesh came from, e.g. {"mesh": path, "key": ...}, for traces
+
+    @property
+    def dim(self):
+        return self.points.shape[1]
+
+    def normalized(self):
+        # Centre on the bounding box and scale to the radius of the unit
+        # hypercube (sqrt(D)), so meshes fit the same projection and sliders
+        points = np.asarray(self.points, dtype=float)
+        centre = (points.min(axis=0) + points.max(axis=0)) / 2
+        points = points - centre
+        radius = np.sqrt((points ** 2).sum(axis=1)).max()
+        if radius > 0:
+            points *= np.sqrt(self.dim) / radius
+        return Mesh(points, self.edges, self.trails, self.source)
+
+
+def _ragged_arange(counts):
+    # [0..c0), [0..c1), ... concatenated
+    counts = np.asarray(counts, dtype=np.intp)
+    starts = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(starts, counts)
+
+
+def _tokenize(data, start=0, keywords=None, strip_slashes=False):
+    # Numeric fields of data[start:] as (values, line of each value, kind of
+    # each value's line). With keywords, only lines starting with one of them
+    # are kept (kind = its position in the list) and the keyword is dropped;
+    # without, every line is kept with kind 0. "#" comments are ignored.
+    values = []
+    lines = []
+    kinds = []
+    line_base = 0
+    pos = start
+    size = len(data)
+    while pos < size:
+        end = min(pos + BLOCK_SIZE, size)
+        if end < size:
+            # Cut blocks at line boundaries
+            newline = data.rfind(b"\n", pos, end)
+            if newline < 0:
+                newline = data.find(b"\n", end)
+            end = size if newline < 0 else newline + 1
+        buf = np.frombuffer(data[pos:end], dtype=np.uint8).copy()
+        pos = end
+
+        index = np.arange(len(buf))
+        newline = buf == NEWLINE
+        line = np.cumsum(newline) - newline
+        line_starts = np.concatenate([[0], np.flatnonzero(newline[:-1]) + 1])
+
+        # Blank from "#" to the end of its line
+        last_hash = np.maximum.accumulate(np.where(buf == ord("#"), index, -1))
+        last_newline = np.maximum.accumulate(np.where(newline, index, -1))
+        buf[last_hash > last_newline] = SPACE
+
+        if keywords is None:
+            line_kind = np.zeros(len(line_starts), dtype=np.intp)
+        else:
+            line_kind = np.full(len(line_starts), -1, dtype=np.intp)
+            padded = np.concatenate([buf, np.full(8, SPACE, dtype=np.uint8)])
+            # Keywords may be indented: match at each line's first non-blank byte
+            first = line_starts
+            if BLANK[padded[line_starts]].any():
+                solid = np.where(BLANK[buf], len(buf), index)
+                first = np.minimum.accumulate(solid[::-1])[::-1][line_starts]
+            for kind, keyword in enumerate(keywords):
+                match = WHITESPACE[padded[first + len(keyword)]]
+                for offset, char in enumerate(keyword):
+                    match &= padded[first + offset] == char
+                line_kind[match] = kind
+                for offset in range(len(keyword)):
+                    buf[first[match] + offset] = SPACE
+            buf[line_kind[line] < 0] = SPACE
+
+        if strip_slashes:
+            # OBJ "f 1/2/3": keep only the vertex index of each field
+            space = WHITESPACE[buf]
+            last_slash = np.maximum.accumulate(np.where(buf == ord("/"), index, -1))
+            last_space = np.maximum.accumulate(np.where(space, index, -1))
+            buf[last_slash > last_space] = SPACE
+
+        space = WHITESPACE[buf]
+        token_starts = np.flatnonzero(~space & np.concatenate([[True], space[:-1]]))
+        buf[space] = SPACE
+        if len(token_starts) == 0:
+            # fromstring reads a blank buffer as [-1.]; a block of only
+            # skipped lines (e.g. "vn", comments) simply has no values
+            block_values = np.zeros(0)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                block_values = np.fromstring(buf.tobytes(), dtype=float, sep=" ")
+        if len(block_values) != len(token_starts):
+            raise ValueError("unexpected non-numeric data in mesh file")
+
+        token_line = line[token_starts]
+        values.append(block_values)
+        lines.append(token_line + line_base)
+        kinds.append(line_kind[token_line])
+        line_base += int(newline.sum())
+
+    if not values:
+        empty = np.zeros(0, dtype=np.intp)
+        return np.zeros(0), empty, empty
+    return np.concatenate(values), np.concatenate(lines), np.concatenate(kinds)
+
+
+def _group_lines(token_line):
+    # First token and token count of every non-empty line, in file order
+    starts = np.flatnonzero(np.concatenate([[True], token_line[1:] != token_line[:-1]]))
+    counts = np.diff(np.concatenate([starts, [len(token_line)]]))
+    return starts, counts
+
+
+def _polygon_edges(indices, counts, closed):
+    # Consecutive index pairs of each polygon (closing it) or polyline
+    counts = np.asarray(counts, dtype=np.intp)
+    position = _ragged_arange(counts)
+    ends = np.repeat(counts, counts)
+    if closed:
+        following = np.where(position + 1 == ends, -position, 1)
+        keep = counts.repeat(counts) > 1
+    else:
+        following = np.ones_like(position)
+        keep = position + 1 < ends
+    flat = np.arange(len(indices))
+    pairs = np.stack([indices[flat[keep]], indices[(flat + following)[keep]]], axis=1)
+    return pairs
+
+
+def _check_range(pairs, vertex_count):
+    # Before _unique_edges, whose packed keys would turn a bad index into a valid-looking edge
+    if len(pairs) and (pairs.min() < 0 or pairs.max() >= vertex_count):
+        raise ValueError("mesh refers to a vertex that does not exist")
+    return pairs
+
+
+def _unique_edges(pairs, vertex_count):
+    # Undirected, without self-loops or duplicates (deduplicated as single int keys)
+    pairs = np.sort(np.asarray(pairs, dtype=np.int64).reshape(-1, 2), axis=1)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    keys = np.sort(pairs[:, 0] * vertex_count + pairs[:, 1])
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+    return np.stack([keys // vertex_count, keys % vertex_count], axis=1).astype(np.intp)
+
+
+def parse_obj(data):
+    # "v x y z" vertices, "f" polygons and "l" polylines (1-based or negative indices)
+    values, token_line, kind = _tokenize(data, keywords=[b"v", b"f", b"l"], strip_slashes=True)
+
+    is_vertex = kind == 0
+    v_starts, v_counts = _group_lines(token_line[is_vertex])
+    v_values = values[is_vertex]
+    if len(v_starts) == 0:
+        raise ValueError("OBJ file has no vertices")
+    # An optional fourth value is the rational weight, not a coordinate
+    if (v_counts < 3).any():
+        raise ValueError("OBJ vertex with fewer than 3 coordinates")
+    points = v_values[v_starts[:, None] + np.arange(3)]
+    vertex_lines = token_line[is_vertex][v_starts]
+
+    pairs = []
+    for code, closed in ((1, True), (2, False)):
+        selected = kind == code
+        if not selected.any():
+            continue
+        lines = token_line[selected]
+        starts, counts = _group_lines(lines)
+        indices = values[selected].astype(np.intp)
+        # Negative indices count back from the vertices defined so far
+        before = np.searchsorted(vertex_lines, lines)
+        indices = np.where(indices < 0, before + indices, indices - 1)
+        pairs.append(_polygon_edges(indices, counts, closed))
+
+    pairs = _check_range(np.concatenate(pairs) if pairs else np.zeros((0, 2), dtype=np.intp), len(points))
+    edges = _unique_edges(pairs, len(points))
+    return points, edges
+
+
+def _off_header(data):
+    # Keyword, dimension, extra values per vertex and offset just past the keyword
+    pos = 0
+    while True:
+        end = data.find(b"\n", pos)
+        end = len(data) if end < 0 else end
+        line = bytes(data[pos:end]).split(b"#")[0].strip()
+        if line or end == len(data):
+            break
+        pos = end + 1
+    keyword = line.split()[0].decode("ascii", "replace") if line else ""
+    if not keyword.endswith("OFF"):
+        raise ValueError("not an OFF file")
+    prefix = keyword[:-3]
+    offset = pos + data[pos:end].find(keyword.encode()) + len(keyword)
+
+    dim = 3
+    if prefix.endswith("n"):
+        dim = None  # read from the file, right after the keyword
+        prefix = prefix[:-1]
+    elif prefix.endswith("4"):
+        dim = 4
+        prefix = prefix[:-1]
+    extras = {"ST": 2, "C": 4}
+    extra = 0
+    for flag, count in extras.items():
+        if flag in prefix:
+            extra += count
+            prefix = prefix.replace(flag, "")
+    normals = "N" in prefix
+    return dim, extra, normals, offset
+
+
+def parse_off(data):
+    dim, extra, normals, offset = _off_header(data)
+    values, token_line, kind = _tokenize(data, start=offset)
+
+    pos = 0
+    if dim is None:
+        dim = int(values[0])
+        pos = 1
+    vertex_count, face_count = int(values[pos]), int(values[pos + 1])
+    pos += 3
+    width = dim + extra + (dim if normals else 0)
+
+    vertex_values = values[pos:pos + vertex_count * width]
+    if len(vertex_values) < vertex_count * width:
+        raise ValueError("OFF file ends inside the vertex list")
+    points = vertex_values.reshape(vertex_count, width)[:, :dim].copy()
+    pos += vertex_count * width
+
+    # Faces, one per line: "n i0 ... i(n-1) [color]"
+    starts, counts = _group_lines(token_line[pos:])
+    starts = starts[:face_count] + pos
+    sizes = values[starts].astype(np.intp)
+    indices = values[np.repeat(starts + 1, sizes) + _ragged_arange(sizes)].astype(np.intp)
+    pairs = _check_range(_polygon_edges(indices, sizes, closed=True), vertex_count)
+    edges = _unique_edges(pairs, vertex_count)
+    return points, edges
+
+
+def load(path, use_cache=True, cache_dir=None):
+    # Parsed, un-normalized mesh; reopening a cached file maps the arrays straight from disk
+    key = cache.file_key(path, "mesh-v2")
+    names = ["points", "edges", "trail_vertices", "trail_offsets"]
+    arrays = cache.load_arrays(key, names, cache_dir) if use_cache else None
+    if arrays is None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("empty mesh file")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if path.lower().endswith(".obj"):
+                    points, edges = parse_obj(data)
+                else:
+                    points, edges = parse_off(data)
+
+        trails = topology.edge_trails(edges, len(points))
+        lengths = [len(t) for t in trails]
+        arrays = {
+            "points": points,
+            "edges": edges,
+            "trail_vertices": np.concatenate(trails) if trails else np.zeros(0, dtype=np.intp),
+            "trail_offsets": np.cumsum([0] + lengths),
+        }
+        if use_cache:
+            cache.save_arrays(key, arrays, cache_dir)
+
+    offsets = arrays["trail_offsets"]
+    trails = [arrays["trail_vertices"][offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+    return Mesh(arrays["points"], arrays["edges"], trails, {"mesh": path, "key": key})
@@ -0,0 +1,44 @@
+import numpy as np
+
+
+class Orientation:
+    # Accumulated rotation, advanced each frame by a small delta rotation
+    # instead of rebuilding every plane rotation from ever-growing angles.
+    # The delta (and its trig) is recomputed only when the speeds change.
+    def __init__(self, transform, renormalize_every=600):
+        self.transform = transform
+        self.renormalize_every = renormalize_every
+        self.matrix = np.identity(transform.dim)
+        self.delta = np.identity(transform.dim)
+        self.speeds = None
+        self.moving = False
+        self.steps = 0
+        self.version = 0  # goes up whenever the matrix changes
+        self._scratch = np.empty_like(self.matrix)
+
+    def set_speeds(self, speeds):
+        speeds = tuple(speeds)
+        if speeds != self.speeds:
+            self.speeds = speeds
+            self.delta = self.transform.matrix(speeds).copy()
+            self.moving = any(speeds)
+
+    def step(self, count=1):
+        # All speeds zero: the delta is the identity, nothing to do
+        if not self.moving or count == 0:
+            return
+        self.version += 1
+        for _ in range(count):
+            np.matmul(self.delta, self.matrix, out=self._scratch)
+            self.matrix, self._scratch = self._scratch, self.matrix
+            self.steps += 1
+            if self.steps % self.renormalize_every == 0:
+                self.reorthonormalize()
+
+    def reorthonormalize(self):
+        # Gram-Schmidt through QR; flipping by sign(diag(R)) keeps the nearest
+        # orthonormal basis, so rounding drift is removed without a visible jump
+        q, r = np.linalg.qr(self.matrix)
+        q *= np.sign(np.diag(r))
+        self.matrix[:] = q
+
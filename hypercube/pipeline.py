@@ -0,0 +1,165 @@
+import threading
+
+import numpy as np
+
+
+class Stage:
+    # One step of the frame pipeline. The output is cached with the inputs it
+    # was computed from and recomputed only when one of them changes. Inputs
+    # are small comparable values: parameters such as scale, and the version
+    # of the upstream stage, which goes up on every recompute.
+    def __init__(self, compute):
+        self.compute = compute
+        self.inputs = None
+        self.output = None
+        self.version = 0
+
+    def update(self, *inputs):
+        if inputs != self.inputs:
+            self.output = self.compute(*inputs)
+            self.inputs = inputs
+            self.version += 1
+        return self.output
+
+
+class FramePipeline:
+    # rotate -> project -> screen, with the solid (shade) and cross-section
+    # (slice) branches off the rotated vertices. With every speed at zero the
+    # rotation stage stays cached, so e.g. dragging Scale only reruns to_screen.
+    # The shader and the cross-section may be attached later, before first use.
+    def __init__(self, engine, orientation, transform, shader=None, section=None):
+        self.orientation = orientation
+        self.shader = shader
+        self.cross_section = section
+        self.rotated = Stage(lambda version: transform.apply(engine.points, orientation.matrix))
+        self.projected = Stage(lambda rotated: engine.project(self.rotated.output))
+        self.screen = Stage(lambda projected, scale, x, y: engine.to_screen(self.projected.output, scale, x, y))
+        self.shaded = Stage(lambda rotated, scale, x, y: self.shader.shade(self.rotated.output, scale, x, y))
+        self.sliced = Stage(lambda rotated, offset: self.cross_section.slice(self.rotated.output, offset))
+        self.section_screen = Stage(
+            lambda sliced, scale, x, y: engine.to_screen(engine.project(self.sliced.output[0]), scale, x, y))
+
+    def rotate(self):
+        self.rotated.update(self.orientation.version)
+        return self.rotated.version
+
+    def wireframe(self, scale, x, y):
+        # Stage holding the (V x 2) screen points
+        self.projected.update(self.rotate())
+        self.screen.update(self.projected.version, scale, x, y)
+        return self.screen
+
+    def solid(self, scale, x, y):
+        # Stage holding (points, polygons, colors) from the shader
+        self.shaded.update(self.rotate(), scale, x, y)
+        return self.shaded
+
+    def section(self, offset, scale, x, y):
+        # Stage holding the section's screen points; its edges are sliced.output[1]
+        self.sliced.update(self.rotate(), offset)
+        self.section_screen.update(self.sliced.version, scale, x, y)
+        return self.section_screen
+
+
+class PipelinedWireframe:
+    # Wireframe stage computed on a worker thread one frame ahead: while the
+    # main thread draws frame N and calls display.update, the worker rotates,
+    # projects and maps frame N+1 (NumPy releases the GIL in those loops).
+    # The two share a pair of preallocated slots, so no array is allocated
+    # per frame; the main thread only ever reads the slot the worker is not
+    # filling. Drawn frames lag the simulation by one frame while it moves.
+    def __init__(self, engine, orientation, transform):
+        self.engine = engine
+        self.orientation = orientation
+        self.transform = transform
+        count, dim = engine.points.shape
+        self.matrices = [np.empty((dim, dim)) for _ in range(2)]
+        self.rotated = [np.empty((count, dim)) for _ in range(2)]
+        self.factors = [np.empty(count) for _ in range(2)]
+        self.screens = [np.empty((count, 2), dtype=np.intp) for _ in range(2)]
+        self.params = [None, None]  # (orientation version, scale, x, y) each slot was filled for
+        self.filling = 0
+        self.queued = False
+        self.shown = None
+        self.output = None
+        self.version = 0
+        self.error = None
+
+        self._job = threading.Event()
+        self._done = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._work, name="transform", daemon=True)
+        self._thread.start()
+
+    def wireframe(self, scale, x, y):
+        # Stage-like: output is the (V x 2) screen points to draw this frame
+        params = (self.orientation.version, scale, x, y)
+        if self.queued:
+            # Computed while the previous frame was drawn
+            self._collect()
+        if params != self.shown:
+            # This frame's transform overlaps with drawing the previous one
+            self._submit(params)
+            if self.output is None:
+                # First frame: nothing to draw meanwhile
+                self._collect()
+        return self
+
+    def close(self):
+        if self._thread.is_alive():
+            if self.queued:
+                self._done.wait()
+            self._stopping = True
+            self._job.set()
+            self._thread.join()
+
+    def _submit(self, params):
+        slot = self.filling
+        self.matrices[slot][:] = self.orientation.matrix
+        self.params[slot] = params
+        self.queued = True
+        self._done.clear()
+        self._job.set()
+
+    def _collect(self):
+        self._done.wait()
+        self.queued = False
+        if self.error is not None:
+            raise self.error
+        slot = self.filling
+        self.filling = 1 - slot
+        self.output = self.screens[slot]
+        self.shown = self.params[slot]
+        self.version += 1
+
+    def _work(self):
+        while True:
+            self._job.wait()
+            self._job.clear()
+            if self._stopping:
+                return
+            try:
+                self._compute(self.filling)
+            except Exception as e:
+                self.error = e
+            self._done.set()
+
+    def _compute(self, slot):
+        # engine.project and to_screen, in place in the slot's buffers
+        _, scale, x, y = self.params[slot]
+        rotated = self.rotated[slot]
+        factor = self.factors[slot]
+        engine = self.engine
+        self.transform.apply(engine.points, self.matrices[slot], out=rotated)
+        for k in range(engine.dim, 2, -1):
+            distance = engine.distances[engine.dim - k]
+            if distance is None:
+                continue
+            np.subtract(distance, rotated[:, k - 1], out=factor)
+            np.divide(1, factor, out=factor)
+            np.multiply(rotated[:, :k - 1], factor[:, None], out=rotated[:, :k - 1])
+        np.multiply(rotated[:, :2], scale, out=rotated[:, :2])
+        screen = self.screens[slot]
+        np.copyto(screen, rotated[:, :2], casting="unsafe")
+        screen[:, 0] += x
+        screen[:, 1] += y
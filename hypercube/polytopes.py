@@ -0,0 +1,145 @@
+import hashlib
+import time
+from itertools import permutations, product
+
+import numpy as np
+
+from . import cache, topology
+from .mesh import Mesh, _ragged_arange
+
+# The regular 4D polytopes beyond the tesseract, built from their standard
+# coordinates. Edges join nearest neighbours, found through a uniform grid
+# (spatial hash) with cells one edge long: each vertex is only compared with
+# the points in its own and the 80 surrounding cells, so construction is
+# near-linear in the vertex count instead of all-pairs.
+
+PHI = (1 + 5 ** 0.5) / 2
+CACHE_VERSION = "polytope-v1"
+
+
+def _even(order):
+    inversions = sum(order[i] > order[j] for i in range(4) for j in range(i + 1, 4))
+    return inversions % 2 == 0
+
+
+ALL = list(permutations(range(4)))
+EVEN = [order for order in ALL if _even(order)]
+
+
+def _orbit(base, orders):
+    # Every sign change and the given coordinate permutations of base, deduplicated
+    base = np.asarray(base, dtype=float)
+    signs = np.array(list(product([1, -1], repeat=4)), dtype=float)
+    points = (base[np.array(orders)][:, None, :] * signs[None, :, :]).reshape(-1, 4)
+    return np.unique(np.round(points, 9), axis=0)
+
+
+def cell24():
+    # 24 permutations of (+-1, +-1, 0, 0)
+    return _orbit([1, 1, 0, 0], ALL)
+
+
+def cell600():
+    # 8 + 16 + 96 vertices on the unit 3-sphere
+    return np.concatenate([
+        _orbit([1, 0, 0, 0], ALL),
+        _orbit([0.5, 0.5, 0.5, 0.5], ALL),
+        _orbit([PHI / 2, 0.5, 1 / (2 * PHI), 0], EVEN),
+    ])
+
+
+def cell120():
+    # 600 vertices on the 3-sphere of radius 2 * sqrt(2)
+    root5 = 5 ** 0.5
+    return np.concatenate([
+        _orbit([0, 0, 2, 2], ALL),
+        _orbit([1, 1, 1, root5], ALL),
+        _orbit([PHI ** -2, PHI, PHI, PHI], ALL),
+        _orbit([PHI ** -1, PHI ** -1, PHI ** -1, PHI ** 2], ALL),
+        _orbit([0, PHI ** -2, 1, PHI ** 2], EVEN),
+        _orbit([0, PHI ** -1, PHI, root5], EVEN),
+        _orbit([PHI ** -1, 1, PHI, 2], EVEN),
+    ])
+
+
+POLYTOPES = {"24-cell": cell24, "120-cell": cell120, "600-cell": cell600}
+
+
+def neighbour_edges(points, tolerance=1e-6):
+    # (E x 2) pairs at the shortest distance. The polytopes are vertex-
+    # transitive, so any one vertex's nearest neighbour gives the edge length.
+    points = np.asarray(points, dtype=float)
+    gaps = np.sqrt(((points[1:] - points[0]) ** 2).sum(axis=1))
+    length = gaps.min()
+
+    # Bucket by grid cell, sorted so each cell is one contiguous run
+    cells = np.floor((points - points.min(axis=0)) / length).astype(np.int64)
+    shape = cells.max(axis=0) + 3
+    keys = np.ravel_multi_index((cells + 1).T, shape)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    pairs = []
+    for offset in product([-1, 0, 1], repeat=cells.shape[1]):
+        neighbour = np.ravel_multi_index((cells + 1 + offset).T, shape)
+        first = np.searchsorted(sorted_keys, neighbour, side="left")
+        count = np.searchsorted(sorted_keys, neighbour, side="right") - first
+        # Every point against every member of its neighbouring cell
+        mine = np.repeat(np.arange(len(points)), count)
+        theirs = order[np.repeat(first, count) + _ragged_arange(count)]
+        keep = mine < theirs
+        mine, theirs = mine[keep], theirs[keep]
+        distance = np.sqrt(((points[mine] - points[theirs]) ** 2).sum(axis=1))
+        close = np.abs(distance - length) < tolerance * length
+        pairs.append(np.stack([mine[close], theirs[close]], axis=1))
+    return np.concatenate(pairs)
+
+
+def polytope(name, use_cache=True, cache_dir=None):
+    # Mesh of a named polytope and {step: seconds} for building it
+    if name not in POLYTOPES:
+        raise ValueError(f"unknown polytope {name!r}")
+    key = hashlib.sha1(f"{CACHE_VERSION}|{name}".encode()).hexdigest()
+    names = ["points", "edges", "trail_vertices", "trail_offsets"]
+    timings = {}
+    start = time.perf_counter()
+    arrays = cache.load_arrays(key, names, cache_dir) if use_cache else None
+    if arrays is not None:
+        timings["cached"] = time.perf_counter() - start
+    else:
+        points = POLYTOPES[name]()
+        timings["vertices"] = time.perf_counter() - start
+        start = time.perf_counter()
+        edges = neighbour_edges(points)
+        timings["edges"] = time.perf_counter() - start
+        start = time.perf_counter()
+        trails = topology.edge_trails(edges, len(points))
+        timings["trails"] = time.perf_counter() - start
+        arrays = {
+            "points": points,
+            "edges": edges,
+            "trail_vertices": np.concatenate(trails),
+            "trail_offsets": np.cumsum([0] + [len(t) for t in trails]),
+        }
+        if use_cache:
+            cache.save_arrays(key, arrays, cache_dir)
+
+    offsets = arrays["trail_offsets"]
+    trails = [arrays["trail_vertices"][offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+    return Mesh(arrays["points"], arrays["edges"], trails, {"polytope": name}), timings
+
+
+if __name__ == "__main__":
+    # Expected vertex and edge counts, with generation times (uncached, then cached)
+    expected = {"24-cell": (24, 96), "120-cell": (600, 1200), "600-cell": (120, 720)}
+    for name, (vertex_count, edge_count) in expected.items():
+        mesh, timings = polytope(name, use_cache=False)
+        assert len(mesh.points) == vertex_count, (name, len(mesh.points))
+        assert len(mesh.edges) == edge_count, (name, len(mesh.edges))
+        degree = np.bincount(mesh.edges.ravel(), minlength=vertex_count)
+        assert (degree == degree[0]).all(), name
+        polytope(name)
+        _, cached = polytope(name)
+        steps = ", ".join(f"{step} {seconds * 1000:.1f} ms" for step, seconds in timings.items())
+        print(f"{name}: {vertex_count} vertices, {edge_count} edges, degree {degree[0]} "
+              f"({steps}; cached {cached['cached'] * 1000:.2f} ms)")
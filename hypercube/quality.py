@@ -0,0 +1,60 @@
+# Render settings from best to cheapest. "normal" is what the app draws when
+# no governor is running.
+#   dots: draw vertex dots            antialias: smooth 1px edges (aalines)
+#   line_width: None keeps the app's   slider_every: recomposite sliders every N frames
+#   resolution: figure drawn at this fraction of screen resolution, then scaled up
+QUALITY_LEVELS = [
+    {"name": "high", "dots": True, "antialias": True, "line_width": None, "slider_every": 1, "resolution": 1.0},
+    {"name": "normal", "dots": True, "antialias": False, "line_width": None, "slider_every": 1, "resolution": 1.0},
+    {"name": "reduced", "dots": False, "antialias": False, "line_width": 1, "slider_every": 2, "resolution": 1.0},
+    {"name": "low", "dots": False, "antialias": False, "line_width": 1, "slider_every": 4, "resolution": 0.75},
+    {"name": "minimal", "dots": False, "antialias": False, "line_width": 1, "slider_every": 8, "resolution": 0.5},
+]
+DEFAULT_LEVEL = 1
+
+
+class QualityGovernor:
+    # Steps quality down when frames blow the budget and back up when there
+    # is clear headroom. Frame times are the busy part of each rendered frame,
+    # averaged over a window; after every change the window starts afresh.
+    def __init__(self, target_fps=60, window=30, levels=QUALITY_LEVELS, level=DEFAULT_LEVEL):
+        self.budget = 1 / target_fps
+        self.window = window
+        self.levels = levels
+        self.level = level
+        self.reason = "initial level"
+        self.changes = 0
+        self._total = 0.0
+        self._count = 0
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    def record(self, frame_time):
+        # Returns True when the level changed
+        self._total += frame_time
+        self._count += 1
+        if self._count < self.window:
+            return False
+        average = self._total / self._count
+
+        if average > self.budget * 0.9 and self.level < len(self.levels) - 1:
+            self.level += 1
+            self.reason = (f"frame time {average * 1000:.1f} ms over the "
+                           f"{self.budget * 1000:.1f} ms budget")
+        elif average < self.budget * 0.4 and self.level > 0:
+            # Upgrading can double the cost, so want more headroom for longer
+            if self._count < self.window * 4:
+                return False
+            self.level -= 1
+            self.reason = f"headroom: frame time {average * 1000:.1f} ms"
+        else:
+            self._total = 0.0
+            self._count = 0
+            return False
+
+        self.changes += 1
+        self._total = 0.0
+        self._count = 0
+        return True
@@ -0,0 +1,157 @@
+import json
+import time
+
+import numpy as np
+import pygame
+
+# Input traces for repeatable performance runs. A recording keeps, for every
+# loop iteration, the simulation steps the scheduler granted, whether the frame
+# was drawn, when it happened, and the input events the loop consumed. Replaying
+# feeds exactly that back headless, so the frames come out identical whatever
+# the machine and only the timings differ between versions.
+#
+# Stored as a compressed .npz of two small record arrays plus a JSON header.
+
+FRAME_DTYPE = np.dtype([("time", "<f8"), ("steps", "<u2"), ("render", "?"), ("events", "<u2")])
+EVENT_DTYPE = np.dtype([("type", "<u4"), ("x", "<i2"), ("y", "<i2"), ("button", "u1"), ("key", "<i4")])
+# Only what the loop and the sliders act on; window and focus events are dropped
+RECORDED = {pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION}
+# The F3 overlay prints live timings, which would make replayed frames differ
+IGNORED_KEYS = {pygame.K_F3}
+
+
+def describe(figure):
+    if figure is None:
+        return "the built-in hypercube"
+    if "polytope" in figure:
+        return f"the {figure['polytope']}"
+    return figure["mesh"]
+
+
+class Recorder:
+    def __init__(self, app):
+        self.header = {
+            "app": type(app).__name__,
+            "dim": app.dim,
+            "figure": app.figure,
+            "vertices": len(app.engine.points),
+            "size": [app.width, app.height],
+            "sliders": [slider.val for slider in app.sliders],
+            # Everything that changes what is drawn, so replays match without the flags
+            "solid": app.solid,
+            "sectioning": app.sectioning,
+            "trails": app.trails.length if app.trails is not None else None,
+            "rasterizer": app.rasterizer is not None,
+            "additive": app.rasterizer is not None and app.rasterizer.additive,
+            "pipelined": app.pipelined is not None,
+            "governor": app.governor is not None,
+        }
+        self.frames = []
+        self.events = []
+        self._start = time.perf_counter()
+
+    def add(self, steps, render, events):
+        count = 0
+        for event in events:
+            if event.type not in RECORDED:
+                continue
+            pos = getattr(event, "pos", (0, 0))
+            self.events.append((event.type, pos[0], pos[1], getattr(event, "button", 0), getattr(event, "key", 0)))
+            count += 1
+        self.frames.append((time.perf_counter() - self._start, steps, render, count))
+
+    def save(self, path):
+        np.savez_compressed(path, header=np.array(json.dumps(self.header)),
+                            frames=np.array(self.frames, dtype=FRAME_DTYPE),
+                            events=np.array(self.events, dtype=EVENT_DTYPE))
+
+
+class Recording:
+    def __init__(self, path):
+        with np.load(path, allow_pickle=False) as data:
+            self.header = json.loads(str(data["header"]))
+            self.frames = data["frames"]
+            self.events = data["events"]
+
+    def __len__(self):
+        return len(self.frames)
+
+    def apply(self, app):
+        # Start from the state the recording started from
+        header = self.header
+        if type(app).__name__ != header["app"]:
+            raise ValueError(f"recording is of {header['app']}, not {type(app).__name__}")
+        if app.dim != header["dim"]:
+            raise ValueError(f"recording is of a {header['dim']}D app, not {app.dim}D")
+        if app.figure != header.get("figure") or len(app.engine.points) != header.get("vertices", len(app.engine.points)):
+            raise ValueError(f"recording is of {describe(header.get('figure'))} "
+                             f"({header.get('vertices')} vertices), not {describe(app.figure)}")
+        if (app.governor is not None) != header.get("governor", False):
+            # Adaptive quality changes what is drawn, so it has to match the recording
+            raise ValueError("recording was made " + ("with" if header.get("governor") else "without") + " --adaptive")
+        for slider, val in zip(app.sliders, header["sliders"]):
+            slider.val = val
+        if header["solid"] and app.can_fill():
+            app.enable_solid()
+        else:
+            app.solid = False
+        if header.get("sectioning") and app.can_section():
+            app.enable_section()
+        else:
+            app.sectioning = False
+        if header.get("trails"):
+            app.enable_trails(header["trails"])
+        else:
+            app.trails = None
+        if header.get("rasterizer"):
+            app.enable_rasterizer(header.get("additive", False))
+        else:
+            app.rasterizer = None
+        if header.get("pipelined"):
+            if app.pipelined is None:
+                app.enable_pipelining()
+        elif app.pipelined is not None:
+            app.pipelined.close()
+            app.pipelined = None
+
+    def __iter__(self):
+        # (steps, render, [pygame events]) per recorded loop iteration
+        offsets = np.concatenate([[0], np.cumsum(self.frames["events"], dtype=np.intp)])
+        for i, frame in enumerate(self.frames.tolist()):
+            events = []
+            for kind, x, y, button, key in self.events[offsets[i]:offsets[i + 1]].tolist():
+                if kind == pygame.KEYDOWN:
+                    if key in IGNORED_KEYS:
+                        continue
+                    events.append(pygame.event.Event(kind, key=key))
+                elif kind in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    events.append(pygame.event.Event(kind, pos=(x, y), button=button))
+                elif kind == pygame.MOUSEMOTION:
+                    events.append(pygame.event.Event(kind, pos=(x, y)))
+                else:
+                    events.append(pygame.event.Event(kind))
+            yield frame[1], frame[2], events
+
+
+def replay(app, recording, writer=None):
+    # Drive the app through a recording as fast as possible; returns frames/sec
+    # of the drawn frames. Nothing is read from the clock or the event queue.
+    recording.apply(app)
+    prof = app.profiler
+    drawn = 0
+    start = time.perf_counter()
+    for steps, render, events in recording:
+        if prof is not None:
+            prof.mark("tick")
+        app.handle_events(events)
+        if prof is not None:
+            prof.mark("events")
+        app.step(steps, render)
+        if render:
+            drawn += 1
+            if writer is not None:
+                writer.write(app.screen)
+    elapsed = time.perf_counter() - start
+    if writer is not None:
+        writer.close()
+    return drawn / elapsed if elapsed > 0 else float("inf")
@@ -0,0 +1,33 @@
+import numpy as np
+
+from . import topology
+
+
+class CrossSection:
+    # Slice of the rotated D-cube by the hyperplane "last axis = offset" (w = c
+    # for the tesseract), a (D-1)-dimensional polytope rebuilt every frame.
+    # Its vertices are where edges cross the hyperplane; its edges join the
+    # two crossing sides of every square that the hyperplane cuts. Each side
+    # counts as crossing when exactly one end is below the offset (half-open),
+    # so a cut square always has exactly two crossing sides.
+    def __init__(self, dim):
+        self.dim = dim
+        self.edges = topology.edges(dim)
+        self.face_edges = topology.face_edges(dim)
+
+    def slice(self, rotated, offset):
+        # Returns the section's vertices (S x D-1) and its edges (K x 2)
+        depth = rotated[:, -1]
+        below = depth < offset
+        start, end = self.edges[:, 0], self.edges[:, 1]
+        crossing = below[start] != below[end]
+        start, end = start[crossing], end[crossing]
+        t = (offset - depth[start]) / (depth[end] - depth[start])
+        points = rotated[start, :-1] + t[:, None] * (rotated[end, :-1] - rotated[start, :-1])
+
+        # Section vertex of every crossing edge, then the crossing pair of each cut square
+        index = np.cumsum(crossing) - 1
+        cut = crossing[self.face_edges]
+        squares = cut.sum(axis=1) == 2
+        pairs = self.face_edges[squares][cut[squares]].reshape(-1, 2)
+        return points, index[pairs]
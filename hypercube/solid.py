@@ -0,0 +1,50 @@
+import numpy as np
+
+from . import topology
+
+
+class SolidShader:
+    # Filled faces for the cube and the tesseract's projected cells. Depth,
+    # normals and shading of every face are computed in one batched pass;
+    # faces turned away from the camera are culled and the rest are ordered
+    # back to front with a single argsort (painter's algorithm).
+    def __init__(self, engine, color, light=(-0.4, -0.6, 0.7), ambient=0.35):
+        self.engine = engine
+        self.quads, self.owner = topology.cell_faces(engine.dim)
+        self.cells = topology.cells(engine.dim)
+        self.color = np.array(color, dtype=float)
+        light = np.array(light, dtype=float)
+        self.light = light / np.linalg.norm(light)
+        self.ambient = ambient
+        # The 3D -> 2D step divides by (distance - z): the viewer sits at z = distance
+        self.camera = np.array([0.0, 0.0, engine.distances[-1]])
+
+    def shade(self, rotated, scale, offset_x, offset_y):
+        # Returns the vertices' screen points, the visible quads as (F x 4 x 2)
+        # screen points ordered far to near, and their colors
+        space = self.engine.project(rotated, target=3)  # (V x 3) after the 4D+ steps
+        corners = space[self.quads]  # (F x 4 x 3)
+        centres = corners.mean(axis=1)
+        cell_centres = space[self.cells].mean(axis=1)[self.owner]
+
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 3] - corners[:, 0])
+        # Point every normal out of its own cell
+        outward = np.einsum("ij,ij->i", normals, centres - cell_centres)
+        normals *= np.where(outward < 0, -1.0, 1.0)[:, None]
+
+        to_camera = self.camera - centres
+        visible = np.einsum("ij,ij->i", normals, to_camera) > 0
+        distance = np.einsum("ij,ij->i", to_camera, to_camera)[visible]
+        order = np.argsort(-distance, kind="stable")
+
+        normals = normals[visible][order]
+        lengths = np.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1
+        diffuse = np.clip(normals @ self.light / lengths, 0, 1)
+        intensity = self.ambient + (1 - self.ambient) * diffuse
+        colors = np.clip(self.color * intensity[:, None], 0, 255).astype(np.intp)
+
+        flat = self.engine.project(space)
+        points = self.engine.to_screen(flat, scale, offset_x, offset_y)
+        polygons = points[self.quads[visible][order]]
+        return points, polygons, colors
@@ -0,0 +1,242 @@
+import io
+import json
+import math
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pygame
+
+# Local frame server: the app renders headless once per frame, the frame is
+# encoded to JPEG once, and the same bytes go to every connected client as
+# an MJPEG stream (multipart/x-mixed-replace), which any browser or <img>
+# tag plays. Clients never queue: each one sends the newest frame when it
+# is ready for one, so a slow client skips frames without holding up the
+# render loop or the other clients.
+
+BOUNDARY = "hypercubeframe"
+
+PAGE = """<!doctype html>
+<html><head><title>{title}</title>
+<style>body {{ margin: 0; background: #000; }} img {{ display: block; width: 100%; }}</style>
+</head><body><img src="/stream" alt="{title}"></body></html>
+"""
+
+
+def encode_jpeg(surface):
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, "frame.jpg")
+    return buffer.getvalue()
+
+
+class FrameBroadcast:
+    # Newest encoded frame and its number, handed to any number of readers
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.frame = None
+        self.number = 0
+        self.closed = False
+
+    def publish(self, frame):
+        with self.condition:
+            self.frame = frame
+            self.number += 1
+            self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def wait(self, after, timeout=None):
+        # (number, frame) of the newest frame after number after; frames in
+        # between are skipped. (after, None) on timeout or close.
+        with self.condition:
+            self.condition.wait_for(lambda: self.number > after or self.closed, timeout)
+            if self.number > after:
+                return self.number, self.frame
+            return after, None
+
+
+class SliderControl:
+    # Slider values set from request threads, applied by the render loop
+    # between frames so the app is only ever touched from one thread
+    def __init__(self, sliders):
+        self.sliders = sliders
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.values = [slider.val for slider in sliders]
+
+    def find(self, name):
+        # By position ("0") or by label ("Scale")
+        if name.isdigit() and int(name) < len(self.sliders):
+            return int(name)
+        for index, slider in enumerate(self.sliders):
+            if slider.text == name:
+                return index
+        raise KeyError(name)
+
+    def set(self, updates):
+        # {name: value}; raises KeyError or ValueError before changing anything
+        parsed = {}
+        for name, value in updates.items():
+            index = self.find(name)
+            slider = self.sliders[index]
+            number = float(value)
+            if not math.isfinite(number):
+                # NaN would slip through the clamp and poison the rotation matrix for good
+                raise ValueError(f"{name} must be a finite number")
+            parsed[index] = min(max(number, slider.min_val), slider.max_val)
+        with self.lock:
+            self.pending.update(parsed)
+            for index, value in parsed.items():
+                self.values[index] = value
+
+    def apply(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            for index, value in pending.items():
+                self.sliders[index].val = value
+            self.values = [slider.val for slider in self.sliders]
+
+    def describe(self):
+        with self.lock:
+            values = list(self.values)
+        return [
+            {"index": index, "text": slider.text, "value": value, "min": slider.min_val, "max": slider.max_val}
+            for index, (slider, value) in enumerate(zip(self.sliders, values))
+        ]
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    # GET /            viewer page
+    # GET /stream      MJPEG stream
+    # GET /frame.jpg   newest frame
+    # GET /sliders     slider values as JSON
+    # GET or POST /set?Scale=200&0=1.5   set sliders by label or position
+    protocol_version = "HTTP/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/":
+            self.send_body(PAGE.format(title=self.server.title).encode(), "text/html; charset=utf-8")
+        elif url.path == "/stream":
+            self.send_stream()
+        elif url.path == "/frame.jpg":
+            _, frame = self.server.broadcast.wait(0, timeout=5)
+            if frame is None:
+                self.send_error(503, "no frame rendered yet")
+            else:
+                self.send_body(frame, "image/jpeg")
+        elif url.path == "/sliders":
+            self.send_json(self.server.control.describe())
+        elif url.path == "/set":
+            self.set_sliders(url.query)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/set":
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("ascii", "replace")
+        self.set_sliders("&".join(part for part in (url.query, body) if part))
+
+    def set_sliders(self, query):
+        try:
+            self.server.control.set(dict(parse_qsl(query)))
+        except KeyError as e:
+            self.send_error(400, f"unknown slider {e}")
+            return
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        self.send_json(self.server.control.describe())
+
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, value):
+        self.send_body(json.dumps(value).encode(), "application/json")
+
+    def send_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        broadcast = self.server.broadcast
+        number = 0
+        try:
+            while True:
+                number, frame = broadcast.wait(number, timeout=1)
+                if frame is None:
+                    if broadcast.closed:
+                        return
+                    continue
+                header = f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\nContent-Length: {len(frame)}\r\n\r\n"
+                self.wfile.write(header.encode())
+                self.wfile.write(frame)
+                self.wfile.write(b"\r\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StreamServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, app, host="127.0.0.1", port=8000):
+        super().__init__((host, port), StreamHandler)
+        self.app = app
+        self.title = app.caption
+        self.broadcast = FrameBroadcast()
+        self.control = SliderControl(app.sliders)
+        self.frames = 0
+
+    def render(self, steps=1, render=True):
+        # One simulation step and, if anything changed on screen, one encode
+        app = self.app
+        prof = app.profiler
+        if prof is not None:
+            prof.mark("tick")
+        start = time.perf_counter()
+        self.control.apply()
+        # No window, but SDL turns SIGINT/SIGTERM into QUIT events
+        app.handle_events(pygame.event.get())
+        if prof is not None:
+            prof.mark("events")
+        if app.step(steps, render):
+            self.broadcast.publish(encode_jpeg(app.screen))
+            self.frames += 1
+        if render:
+            app.govern(start)
+
+    def run(self):
+        # Requests are served on their own threads; rendering stays on this one
+        thread = threading.Thread(target=self.serve_forever, name="http", daemon=True)
+        thread.start()
+        host, port = self.server_address[:2]
+        print(f"streaming on http://{host}:{port}/", file=sys.stderr)
+        app = self.app
+        try:
+            while app.running:
+                app.scheduler.wait()
+                self.render(app.scheduler.steps(), app.scheduler.should_render())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.broadcast.close()
+            self.shutdown()
+            self.server_close()
@@ -0,0 +1,145 @@
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pygame
+
+from .engine import HypercubeEngine
+from .orientation import Orientation
+from .render import Renderer
+from .transform import Transform, all_planes
+
+# Batch rendering of parameter sweeps. Every (dimension, speeds, scale)
+# combination of a spec is rendered for a fixed number of frames on a process
+# pool; each worker draws on its own offscreen surface and writes straight into
+# a shared memory-mapped frame store of shape (sets, frames, height, width, 3).
+#
+# Spec (JSON):
+#   {"frames": 120, "size": [320, 240],
+#    "dims": [3, 4],
+#    "speeds": [0.5, [1.2, 0.3]],   # rad/s: one value for every plane, or a
+#                                   # list for the first planes (rest stay 0)
+#    "scales": [80, 120]}
+#
+# The store is PATH (raw frames) plus PATH.json describing shape and sets.
+
+DT = 1 / 60
+CHUNK_FRAMES = 30  # frames per task, so a few large sets still spread over every core
+STYLE = {"background": (0, 0, 0), "edge_color": (100, 255, 100), "edge_width": 1,
+         "vertex_color": (255, 255, 255), "vertex_radius": 3}
+
+
+def parameter_sets(spec):
+    sets = []
+    for dim, speeds, scale in itertools.product(spec["dims"], spec["speeds"], spec["scales"]):
+        planes = len(all_planes(dim))
+        if isinstance(speeds, (int, float)):
+            speeds = [speeds] * planes
+        speeds = (list(speeds) + [0.0] * planes)[:planes]
+        sets.append({"dim": dim, "speeds": speeds, "scale": scale})
+    return sets
+
+
+class FrameStore:
+    # Frames of every parameter set, store[set_index, frame] -> (H x W x 3) uint8
+    def __init__(self, path, mode="r"):
+        with open(path + ".json") as f:
+            self.meta = json.load(f)
+        self.sets = self.meta["sets"]
+        self.frames = np.memmap(path, dtype=np.uint8, mode=mode, shape=tuple(self.meta["shape"]))
+
+    @classmethod
+    def create(cls, path, sets, frames, width, height):
+        meta = {"shape": [len(sets), frames, height, width, 3], "dt": DT, "sets": sets}
+        with open(path + ".json", "w") as f:
+            json.dump(meta, f, indent=2)
+        # Sized up front so every worker can map it and write its own frames
+        with open(path, "wb") as f:
+            f.truncate(len(sets) * frames * height * width * 3)
+        return cls(path, mode="r+")
+
+    def __getitem__(self, key):
+        return self.frames[key]
+
+    def __len__(self):
+        return len(self.sets)
+
+
+class SweepRenderer:
+    # One per worker: an offscreen surface and the engine of each dimension seen
+    def __init__(self, width, height):
+        # Surfaces, drawing and tobytes need no pygame.init(); skipping it keeps
+        # workers from starting audio and video subsystems they never use
+        self.screen = pygame.Surface((width, height))
+        self.renderer = Renderer(self.screen, STYLE["background"], display=False)
+        self.offset_x = width // 2
+        self.offset_y = height // 2
+        self._figures = {}
+
+    def figure(self, dim):
+        if dim not in self._figures:
+            self._figures[dim] = (HypercubeEngine(dim), Transform(dim, all_planes(dim)))
+        return self._figures[dim]
+
+    def render(self, params, start, stop, out):
+        # Frames start..stop-1 of one set into out[0 .. stop-start-1]
+        engine, transform = self.figure(params["dim"])
+        orientation = Orientation(transform)
+        orientation.set_speeds([speed * DT for speed in params["speeds"]])
+        # Frame n shows the orientation after n steps, as in the app
+        orientation.step(start)
+        for i in range(stop - start):
+            self.screen.fill(STYLE["background"])
+            rotated = transform.apply(engine.points, orientation.matrix)
+            points = engine.to_screen(engine.project(rotated), params["scale"], self.offset_x, self.offset_y)
+            self.renderer.draw_figure(points, engine.trails, STYLE["edge_color"], STYLE["edge_width"],
+                                      STYLE["vertex_color"], STYLE["vertex_radius"])
+            out[i] = np.frombuffer(pygame.image.tobytes(self.screen, "RGB"), dtype=np.uint8).reshape(out.shape[1:])
+            orientation.step()
+
+
+_worker = None
+
+
+def _init_worker(path, width, height):
+    global _worker
+    _worker = (FrameStore(path, mode="r+"), SweepRenderer(width, height))
+
+
+def _render_task(task):
+    index, start, stop = task
+    store, renderer = _worker
+    renderer.render(store.sets[index], start, stop, store[index, start:stop])
+    store.frames.flush()
+    return stop - start
+
+
+def tasks(sets, frames, chunk=CHUNK_FRAMES):
+    return [(index, start, min(start + chunk, frames))
+            for index in range(len(sets)) for start in range(0, frames, chunk)]
+
+
+def render_sweep(spec, path, workers=None):
+    # Renders the whole sweep into the store at path; returns (store, frames/sec)
+    width, height = spec.get("size", [320, 240])
+    frames = spec["frames"]
+    sets = parameter_sets(spec)
+    store = FrameStore.create(path, sets, frames, width, height)
+    workers = workers or os.cpu_count() or 1
+    jobs = tasks(sets, frames)
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(path, width, height)
+        done = sum(map(_render_task, jobs))
+    else:
+        # spawn: workers start clean instead of inheriting this process's SDL state
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers, _init_worker, (path, width, height)) as pool:
+            done = sum(pool.imap_unordered(_render_task, jobs))
+    elapsed = time.perf_counter() - start
+    return store, done / elapsed if elapsed > 0 else math.inf
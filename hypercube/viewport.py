@@ -0,0 +1,107 @@
+import numpy as np
+import pygame
+
+from .app import HypercubeApp
+from .quality import DEFAULT_LEVEL, QUALITY_LEVELS
+from .render import Renderer
+
+
+class Viewport:
+    # One view of the shared rotated vertices: its own projection distances
+    # (None = orthographic step) drawn into its own subsurface, with its own
+    # dirty regions
+    def __init__(self, screen, rect, engine, distances, label, background, font):
+        self.rect = pygame.Rect(rect)
+        self.surface = screen.subsurface(self.rect)
+        self.renderer = Renderer(self.surface, background, display=False)
+        self.engine = engine
+        self.distances = distances
+        self.label = font.render(label, True, (160, 160, 160))
+        self.offset_x = self.rect.width // 2
+        self.offset_y = self.rect.height // 2 + 10
+        # Match the unrotated figure's size to the default projection, so one
+        # scale slider suits every view
+        reference = np.abs(engine.project(engine.points)).max()
+        own = np.abs(engine.project(engine.points, distances=distances)).max()
+        self.zoom = reference / own
+
+    def draw(self, rotated, scale, edge_color, edge_width, vertex_color, vertex_radius, antialias=False):
+        self.renderer.clear()
+        projected = self.engine.project(rotated, distances=self.distances)
+        points = self.engine.to_screen(projected, scale * self.zoom, self.offset_x, self.offset_y)
+        self.renderer.draw_figure(points, self.engine.trails, edge_color, edge_width,
+                                  vertex_color, vertex_radius, antialias)
+        # Frame and label go on top; cheap, and the figure may have covered them
+        self.surface.blit(self.label, (8, 6))
+        pygame.draw.rect(self.surface, (70, 70, 70), self.surface.get_rect(), 1)
+
+    def flush(self):
+        # Changed regions in screen coordinates
+        return [rect.move(self.rect.topleft) for rect in self.renderer.flush()]
+
+
+class MultiViewApp(HypercubeApp):
+    # Several projections of one figure side by side. Each frame rotates the
+    # vertices once; every viewport then runs only its projection and drawing.
+    views = []  # (label, distances per perspective step, outermost first)
+    columns = 2
+    view_area = (320, 0, 680, 600)  # right of the sliders
+    single_view = False  # wireframes only: no faces, section, trails, rasterizer or worker
+
+    def __init__(self, headless=False, mesh=None):
+        super().__init__(headless, mesh)
+        self.fillable = False  # filled faces assume the default projection
+        self.sliceable = False  # and so does the cross-section
+        font = pygame.font.Font(None, 20)
+        x, y, w, h = self.view_area
+        rows = -(-len(self.views) // self.columns)
+        width, height = w // self.columns, h // rows
+        self.viewports = [
+            Viewport(self.screen, (x + (i % self.columns) * width, y + (i // self.columns) * height, width, height),
+                     self.engine, distances, label, self.background, font)
+            for i, (label, distances) in enumerate(self.views)
+        ]
+
+    def present(self):
+        rects = self.renderer.flush()
+        for viewport in self.viewports:
+            rects += viewport.flush()
+        if not self.headless:
+            pygame.display.update(rects)
+
+    def draw(self):
+        prof = self.profiler
+        quality = self.governor.settings if self.governor is not None else QUALITY_LEVELS[DEFAULT_LEVEL]
+        self.frame_count += 1
+        # The screen-wide renderer only tracks the panel; it is cleared once
+        first = self.renderer.previous is None
+        if first:
+            self.renderer.clear()
+        if self.show_overlay and self.overlay.rect is not None:
+            self.renderer.clear_area(self.overlay.rect)
+        if self.frame_count % quality["slider_every"] == 0:
+            for area in self.panel.update():
+                self.renderer.clear_area(area)
+        if prof is not None:
+            prof.mark("sliders")
+
+        scale = self.sliders[len(self.planes)].val
+        rotated = self.transform.apply(self.engine.points, self.orientation.matrix)
+        if prof is not None:
+            prof.mark("transform")
+
+        edge_width = quality["line_width"] or self.edge_width
+        vertex_radius = self.vertex_radius if quality["dots"] else 0
+        for viewport in self.viewports:
+            viewport.draw(rotated, scale, self.edge_color, edge_width, self.vertex_color, vertex_radius,
+                          quality["antialias"])
+        if prof is not None:
+            prof.mark("draw")
+
+        # Views never reach the panel, so only slider changes need compositing
+        self.panel.draw(self.screen, self.renderer.touched() if first else self.renderer.dirty)
+        if self.show_overlay:
+            self.renderer.mark_dirty(self.overlay.draw(self.screen))
+        if prof is not None:
+            prof.mark("sliders")
+        return True
@@ -0,0 +1,59 @@
+import argparse
+import os
+import time
+
+import pygame
+
+from hypercube.instances import InstancedScene, max_instances
+from hypercube.scheduler import FrameScheduler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grid of independently rotating hypercubes")
+    parser.add_argument("--dim", type=int, default=4)
+    parser.add_argument("--instances", type=int, default=400)
+    parser.add_argument("--find-max", action="store_true",
+                        help="report how many instances fit in a 60 fps frame, then exit")
+    args = parser.parse_args(argv)
+
+    if args.find_max:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        count = max_instances(args.dim, pygame.Surface((1000, 600)))
+        print(f"{count} instances of the {args.dim}-cube sustain 60 fps")
+        pygame.quit()
+        return
+
+    pygame.init()
+    screen = pygame.display.set_mode((1000, 600))
+    scene = InstancedScene(args.dim, args.instances, 1000, 600)
+    scheduler = FrameScheduler(60)
+    frames = 0
+    started = time.perf_counter()
+    running = True
+    while running:
+        scheduler.wait()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+
+        scene.step(scheduler.steps())
+        if scheduler.should_render():
+            screen.fill((0, 0, 0))
+            scene.draw(screen, scene.project())
+            pygame.display.update()
+
+        frames += 1
+        if frames % 60 == 0:
+            now = time.perf_counter()
+            fps = 60 / (now - started)
+            started = now
+            pygame.display.set_caption(f"{args.instances} x {args.dim}-cube, {fps:.0f} fps")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import argparse
+import json
+import os
+
+from hypercube.sweep import render_sweep
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every combination of a parameter sweep in parallel")
+    parser.add_argument("spec", help="sweep spec (JSON): frames, size, dims, speeds, scales")
+    parser.add_argument("--output", default="sweep.frames",
+                        help="frame store to write; its description goes to OUTPUT.json")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per core)")
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    store, fps = render_sweep(spec, args.output, args.workers)
+    sets, frames, height, width, _ = store.frames.shape
+    print(f"{sets} parameter sets x {frames} frames ({width}x{height}) -> {args.output}")
+    print(f"{args.workers} workers, {fps:.1f} frames/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold-start measurement of the desktop and web entry points. Every run is a
+# fresh interpreter, so imports are paid the way a user pays them. Reports
+# the import time of the entry module, the time to build the app, and the
+# time from process launch to the first presented frame (offscreen, SDL
+# dummy driver), plus which hypercube modules the first frame loaded.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# name: (directory put on sys.path, module, expression building the app)
+ENTRY_POINTS = {
+    "desktop": (ROOT, "rotating_tesseract", "module.RotatingTesseract(headless=True)"),
+    "web": (os.path.join(ROOT, "web_src"), "main", "module.create_app(headless=True)"),
+}
+
+PROBE = """
+import json, os, sys, time
+launched = time.time()
+start = time.perf_counter()
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+sys.path.insert(0, {path!r})
+module = __import__({module!r})
+imported = time.perf_counter()
+app = {factory}
+created = time.perf_counter()
+app.step()
+drawn = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "init": created - imported,
+    "draw": drawn - created,
+    "drawn_at": time.time(),
+    "modules": sorted(name for name in sys.modules if name.split(".")[0] == "hypercube"),
+}}))
+"""
+
+
+def measure(name, runs):
+    path, module, factory = ENTRY_POINTS[name]
+    code = PROBE.format(path=path, module=module, factory=factory)
+    results = []
+    for _ in range(runs):
+        launched = time.time()
+        output = subprocess.run([sys.executable, "-c", code], cwd=path, capture_output=True, text=True, check=True)
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        result["first_frame"] = result["drawn_at"] - launched
+        results.append(result)
+    summary = {key: statistics.median(r[key] for r in results) for key in ("import", "init", "draw", "first_frame")}
+    summary["modules"] = results[0]["modules"]
+    package = os.path.join(path, "hypercube")
+    summary["bundle"] = sum(os.path.getsize(os.path.join(package, f)) for f in os.listdir(package) if f.endswith(".py"))
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure import time and time to first frame")
+    parser.add_argument("entries", nargs="*", metavar="ENTRY",
+                        help=f"entry points to measure: {', '.join(ENTRY_POINTS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per entry point (median reported)")
+    parser.add_argument("--budget", type=float, metavar="MS",
+                        help="exit with status 1 if any median time to first frame exceeds this")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+    for name in args.entries:
+        if name not in ENTRY_POINTS:
+            parser.error(f"unknown entry point {name!r}")
+
+    results = {name: measure(name, args.runs) for name in args.entries or ENTRY_POINTS}
+    print(f"{'entry':<10}{'import ms':>11}{'init ms':>9}{'draw ms':>9}{'first frame ms':>16}{'modules':>9}{'KiB':>7}")
+    for name, r in results.items():
+        print(f"{name:<10}{r['import'] * 1000:>11.1f}{r['init'] * 1000:>9.1f}{r['draw'] * 1000:>9.1f}"
+              f"{r['first_frame'] * 1000:>16.1f}{len(r['modules']):>9}{r['bundle'] / 1024:>7.1f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "results": results}, f, indent=2)
+
+    if args.budget is not None:
+        over = [name for name, r in results.items() if r["first_frame"] * 1000 > args.budget]
+        if over:
+            print(f"over the {args.budget:.0f} ms budget: {', '.join(over)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
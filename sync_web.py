@@ -0,0 +1,42 @@
+import os
+import shutil
+import sys
+
+# Copies the hypercube modules the web build needs into web_src/hypercube and
+# removes the rest, so the pygbag bundle carries only the geometry core, the
+# sliders and the extras reachable from the browser (F, S, T and F3 keys).
+# Desktop-only modules (CLI, headless output, mesh files, sweeps, streaming,
+# replay) stay out of the download.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(ROOT, "hypercube")
+TARGET = os.path.join(ROOT, "web_src", "hypercube")
+
+WEB_MODULES = [
+    # First frame
+    "__init__", "app", "engine", "orientation", "pipeline", "quality", "render", "scheduler", "topology",
+    "transform", "ui",
+    # Key toggles: filled faces, cross-section, trails, profiler overlay
+    "solid", "section", "afterimage", "raster", "profiler",
+]
+
+
+def main():
+    os.makedirs(TARGET, exist_ok=True)
+    wanted = {f"{name}.py" for name in WEB_MODULES}
+    for name in sorted(os.listdir(TARGET)):
+        path = os.path.join(TARGET, name)
+        if name not in wanted:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+    size = 0
+    for name in sorted(wanted):
+        shutil.copyfile(os.path.join(SOURCE, name), os.path.join(TARGET, name))
+        size += os.path.getsize(os.path.join(TARGET, name))
+    print(f"{len(wanted)} modules, {size / 1024:.1f} KiB in {os.path.relpath(TARGET, ROOT)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
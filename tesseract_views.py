@@ -0,0 +1,17 @@
+
+from hypercube.cli import main
+from hypercube.viewport import MultiViewApp
+from rotating_tesseract import RotatingTesseract
+
+class TesseractViews(MultiViewApp, RotatingTesseract):
+    caption = "Rotating Tesseract, four projections"
+    # Viewer distance of the 4D -> 3D step, then of the 3D -> 2D step (None: orthographic)
+    views = [
+        ("4D 3, 3D 4 (default)", [3, 4]),
+        ("4D 2.5, 3D 4 (closer in 4D)", [2.5, 4]),
+        ("4D orthographic, 3D 4", [None, 4]),
+        ("4D 3, 3D 8 (farther in 3D)", [3, 8]),
+    ]
+
+if __name__ == "__main__":
+    main(TesseractViews)
@@ -0,0 +1,34 @@
+import pytest
+
+from hypercube import mesh
+
+
+def test_block_without_numbers(monkeypatch):
+    # A block holding only lines the parser skips must not read as non-numeric data
+    monkeypatch.setattr(mesh, "BLOCK_SIZE", 64)
+    data = b"v 0 0 0\nv 1 0 0\nv 0 1 0\n" + b"vn 0 0 1\n# normals only\n" * 40 + b"f 1 2 3\n"
+    points, edges = mesh.parse_obj(data)
+    assert points.shape == (3, 3)
+    assert len(edges) == 3
+
+
+def test_off_face_past_the_vertex_list():
+    with pytest.raises(ValueError, match="does not exist"):
+        mesh.parse_off(b"OFF\n3 1 0\n0 0 0\n1 0 0\n0 1 0\n3 0 1 5\n")
+
+
+def test_obj_line_past_the_vertex_list():
+    with pytest.raises(ValueError, match="does not exist"):
+        mesh.parse_obj(b"v 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 1\nl 1 5\n")
+
+
+def test_obj_negative_index_before_the_first_vertex():
+    with pytest.raises(ValueError, match="does not exist"):
+        mesh.parse_obj(b"l -1 1\nv 0 0 0\nv 1 0 0\n")
+
+
+def test_obj_indented_lines():
+    data = b"v 0 0 0\n  v 1 0 0\n\tv 0 1 0\n v 0 0 5\n   f 1 2 3 4\n"
+    points, edges = mesh.parse_obj(data)
+    assert points.tolist() == [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 5]]
+    assert edges.tolist() == [[0, 1], [0, 3], [1, 2], [2, 3]]
@@ -0,0 +1,42 @@
+from math import comb
+
+import numpy as np
+import pytest
+
+from hypercube import topology
+
+DIMS = range(1, 11)
+
+
+@pytest.mark.parametrize("d", DIMS)
+def test_vertex_and_edge_counts(d):
+    assert len(topology.vertices(d)) == 2 ** d
+    assert len(topology.edges(d)) == d * 2 ** (d - 1)
+
+
+@pytest.mark.parametrize("d", DIMS)
+def test_face_and_cell_counts(d):
+    assert len(topology.faces(d)) == comb(d, 2) * 2 ** (d - 2)
+    assert len(topology.cells(d)) == comb(d, 3) * 2 ** (d - 3)
+    assert len(topology.cell_faces(d)[0]) == 6 * len(topology.cells(d))
+
+
+@pytest.mark.parametrize("d", DIMS)
+def test_edges_join_vertices_one_coordinate_apart(d):
+    vertices = topology.vertices(d)
+    edges = topology.edges(d)
+    diff = np.abs(vertices[edges[:, 0]] - vertices[edges[:, 1]]).sum(axis=1)
+    assert (diff == 2).all()
+
+
+@pytest.mark.parametrize("d", DIMS)
+def test_face_edges_are_the_sides_of_each_face(d):
+    sides = topology.edges(d)[topology.face_edges(d)]  # (F x 4 x 2)
+    corners = np.repeat(topology.faces(d), 2, axis=1)
+    assert (np.sort(sides.reshape(-1, 8), axis=1) == np.sort(corners, axis=1)).all()
+
+
+@pytest.mark.parametrize("d", DIMS)
+def test_trails_walk_every_edge(d):
+    walked = {tuple(sorted(pair)) for t in topology.trails(d) for pair in zip(t[:-1].tolist(), t[1:].tolist())}
+    assert walked == set(map(tuple, topology.edges(d).tolist()))
@@ -0,0 +1,73 @@
+import numpy as np
+import pygame
+
+from .raster import PixelRasterizer
+
+
+class MotionTrails:
+    # Afterimage of the last K screen positions of every vertex. Positions
+    # are written in place into a preallocated (K x V x 2) ring buffer, and
+    # the segments between consecutive positions are rasterized in one
+    # batched pass, oldest first so newer (brighter) ones stay on top.
+    def __init__(self, surface, vertex_count, length=64):
+        self.surface = surface
+        self.rasterizer = PixelRasterizer(surface)
+        self.history = np.zeros((length, vertex_count, 2), dtype=np.intp)
+        self.flat = self.history.reshape(-1, 2)
+        self.length = length
+        self.head = 0  # slot written next
+        self.count = 0
+        self.version = None  # stage version last recorded
+        self._shades = {}
+
+    def update(self, stage):
+        # Record the stage's screen points once per new version
+        if stage.version != self.version:
+            self.version = stage.version
+            self.history[self.head] = stage.output
+            self.head = (self.head + 1) % self.length
+            self.count = min(self.count + 1, self.length)
+
+    def reset(self):
+        self.count = 0
+        self.version = None
+
+    def shades(self, color, background):
+        # Mapped pixel value per segment age, faint (oldest) to nearly full colour
+        key = (color, background, self.count)
+        if key not in self._shades:
+            steps = self.count
+            self._shades[key] = np.array([
+                self.surface.map_rgb([b + (c - b) * (age + 1) // steps for c, b in zip(color, background)])
+                for age in range(steps - 1)
+            ])
+        return self._shades[key]
+
+    def draw(self, color, background):
+        # Returns the rect covered, or None when there is no trail yet
+        if self.count < 2:
+            return None
+        vertex_count = self.history.shape[1]
+        slots = (self.head - self.count + np.arange(self.count)) % self.length
+        vertices = np.arange(vertex_count)
+        edges = np.stack([(slots[:-1, None] * vertex_count + vertices).ravel(),
+                          (slots[1:, None] * vertex_count + vertices).ravel()], axis=1)
+        ages = np.repeat(np.arange(self.count - 1), vertex_count)
+
+        rasterizer = self.rasterizer
+        x, y, labels = rasterizer.buffers(rasterizer.pixel_count(self.flat, edges, 0), labelled=True)
+        total = rasterizer.edge_pixels(self.flat, edges, x, y, ages, labels)
+        x, y, labels = x[:total], y[:total], labels[:total]
+        inside = (x >= 0) & (x < rasterizer.width) & (y >= 0) & (y < rasterizer.height)
+        if not inside.all():
+            x, y, labels = x[inside], y[inside], labels[inside]
+
+        pixels = pygame.surfarray.pixels2d(self.surface)
+        pixels[x, y] = self.shades(color, background)[labels]
+        del pixels
+
+        points = self.history[slots].reshape(-1, 2)
+        low = points.min(axis=0)
+        high = points.max(axis=0)
+        rect = pygame.Rect(int(low[0]) - 1, int(low[1]) - 1, int(high[0] - low[0]) + 3, int(high[1] - low[1]) + 3)
+        return rect.clip(self.surface.get_rect())
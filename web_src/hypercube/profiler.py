@@ -0,0 +1,108 @@
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+# Loop phases in the order they run; "frame" is the busy time of the whole
+# frame, i.e. everything except waiting for the next frame ("tick")
+STAGES = ["tick", "events", "update", "transform", "draw", "sliders", "display", "frame"]
+
+
+class FrameProfiler:
+    # Rolling per-stage frame timings. The app keeps this as None when
+    # profiling is off, so the hot path only pays for an "is not None" test.
+    def __init__(self, window=600):
+        self.window = window
+        self.samples = {stage: np.zeros(window) for stage in STAGES}
+        self.frames = 0
+        self._current = dict.fromkeys(STAGES, 0.0)
+        self._last = 0.0
+        self.start()
+
+    def start(self):
+        for stage in self._current:
+            self._current[stage] = 0.0
+        self._last = time.perf_counter()
+
+    def mark(self, stage):
+        # Charge the time since the previous mark to stage (repeat marks add up)
+        now = time.perf_counter()
+        self._current[stage] += now - self._last
+        self._last = now
+
+    def end(self):
+        current = self._current
+        current["frame"] = sum(current.values()) - current["tick"] - current["frame"]
+        slot = self.frames % self.window
+        for stage, elapsed in current.items():
+            self.samples[stage][slot] = elapsed
+        self.frames += 1
+        # Whatever follows belongs to the next frame
+        self.start()
+
+    def stats(self):
+        # p50/p95/max in milliseconds over the rolling window
+        count = min(self.frames, self.window)
+        result = {}
+        for stage in STAGES:
+            data = self.samples[stage][:count] * 1000
+            if count:
+                p50, p95 = np.percentile(data, [50, 95])
+                result[stage] = {"p50": float(p50), "p95": float(p95), "max": float(data.max()),
+                                 "mean": float(data.mean())}
+            else:
+                result[stage] = {"p50": 0.0, "p95": 0.0, "max": 0.0, "mean": 0.0}
+        return result
+
+    def dump(self, path):
+        # CSV for a .csv path, JSON otherwise
+        stats = self.stats()
+        samples = min(self.frames, self.window)
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["stage", "p50_ms", "p95_ms", "max_ms", "mean_ms", "samples"])
+                for stage, s in stats.items():
+                    writer.writerow([stage, s["p50"], s["p95"], s["max"], s["mean"], samples])
+        else:
+            with open(path, "w") as f:
+                json.dump({"frames": self.frames, "samples": samples, "stages": stats}, f, indent=2)
+
+
+class ProfilerOverlay:
+    # Live p50/p95/max table in the bottom-left corner, refreshed a few times a second
+    columns = (110, 160, 210)  # right edges of the p50, p95 and max columns
+
+    def __init__(self, profiler, font, position, refresh=20):
+        self.profiler = profiler
+        self.font = font
+        self.position = position
+        self.refresh = refresh
+        self.line_height = font.get_linesize()
+        self.rect = None
+        self._surface = None
+
+    def render(self):
+        color = (255, 255, 0)
+        rows = [("stage (ms)", "p50", "p95", "max")]
+        for stage, s in self.profiler.stats().items():
+            rows.append((stage, f"{s['p50']:.2f}", f"{s['p95']:.2f}", f"{s['max']:.2f}"))
+
+        width = self.columns[-1] + 40
+        surface = pygame.Surface((width, self.line_height * len(rows)))
+        surface.set_colorkey((0, 0, 0))
+        for i, row in enumerate(rows):
+            y = i * self.line_height
+            surface.blit(self.font.render(row[0], True, color), (0, y))
+            for right, text in zip(self.columns, row[1:]):
+                cell = self.font.render(text, True, color)
+                surface.blit(cell, cell.get_rect(topright=(right, y)))
+        return surface
+
+    def draw(self, screen):
+        if self._surface is None or self.profiler.frames % self.refresh == 0:
+            self._surface = self.render()
+        self.rect = screen.blit(self._surface, self.position)
+        return self.rect
@@ -0,0 +1,177 @@
+import numpy as np
+import pygame
+
+# Rasterizes a whole wireframe with array operations and writes the pixels
+# straight into the surface through pygame.surfarray. Cost grows with the
+# number of pixels touched, not with the number of vertices and edges, so
+# 8D-10D hypercubes and large point clouds need no per-primitive Python calls.
+
+
+class PixelRasterizer:
+    def __init__(self, surface, additive=False):
+        self.surface = surface
+        self.width, self.height = surface.get_size()
+        self.additive = additive  # colours add up and saturate where lines overlap
+        # Pixel coordinate buffers, reused across frames and grown when needed
+        self._capacity = 0
+        self._x = None
+        self._y = None
+        self._labels = None
+        self._disks = {}
+
+    def buffers(self, count, labelled=False):
+        # Views of count pixels into the reused x, y (and, if labelled, label)
+        # buffers, for callers that fill them through edge_pixels
+        if count > self._capacity:
+            self._capacity = max(count, 2 * self._capacity, 1 << 14)
+            self._x = np.empty(self._capacity, dtype=np.int32)
+            self._y = np.empty(self._capacity, dtype=np.int32)
+            self._labels = None
+        if not labelled:
+            return self._x[:count], self._y[:count]
+        if self._labels is None:
+            self._labels = np.empty(self._capacity, dtype=np.intp)
+        return self._x[:count], self._y[:count], self._labels[:count]
+
+    def disk(self, radius):
+        # (K x 2) pixel offsets of a filled circle
+        if radius not in self._disks:
+            span = np.arange(-radius, radius + 1)
+            dx, dy = np.meshgrid(span, span, indexing="ij")
+            inside = dx ** 2 + dy ** 2 <= radius ** 2 + radius
+            self._disks[radius] = np.stack([dx[inside], dy[inside]], axis=1)
+        return self._disks[radius]
+
+    def clip(self, start, end):
+        # Liang-Barsky against the surface for every segment at once, so a
+        # huge zoom never walks pixels that are off screen
+        if (start.min() >= 0 and end.min() >= 0 and max(start[:, 0].max(), end[:, 0].max()) <= self.width - 1
+                and max(start[:, 1].max(), end[:, 1].max()) <= self.height - 1):
+            # Everything on screen (the usual case): nothing to cut
+            return start, end, np.ones(len(start), dtype=bool)
+        delta = end - start
+        low = np.zeros(len(start))
+        high = np.ones(len(start))
+        limits = [(-delta[:, 0], start[:, 0]), (delta[:, 0], self.width - 1 - start[:, 0]),
+                  (-delta[:, 1], start[:, 1]), (delta[:, 1], self.height - 1 - start[:, 1])]
+        keep = np.ones(len(start), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for p, q in limits:
+                ratio = q / p
+                keep &= (p != 0) | (q >= 0)
+                low = np.where(p < 0, np.maximum(low, ratio), low)
+                high = np.where(p > 0, np.minimum(high, ratio), high)
+        keep &= low <= high
+        low = low[keep, None]
+        high = high[keep, None]
+        start, delta = start[keep], delta[keep]
+        return start + delta * low, start + delta * high, keep
+
+    def edge_pixels(self, points, edges, out_x, out_y, labels=None, out_labels=None):
+        # DDA: a segment of n steps lights n + 1 pixels at t = 0, 1/n, ..., 1.
+        # Writes into the front of out_x/out_y (and each pixel's edge label
+        # into out_labels) and returns the pixel count
+        start, end, keep = self.clip(points[edges[:, 0]].astype(float), points[edges[:, 1]].astype(float))
+        start = np.rint(start)
+        delta = np.rint(end) - start
+        steps = np.maximum(np.abs(delta[:, 0]), np.abs(delta[:, 1]))
+        counts = steps.astype(np.intp) + 1
+        if len(counts) == 0:
+            # Every segment clipped away
+            return 0
+        total = int(counts.sum())
+        # Step index within each segment, without a per-pixel segment lookup
+        # float32 halves the memory traffic and is exact enough for screen coordinates
+        t = np.ones(total, dtype=np.float32)
+        t[0] = 0
+        t[np.cumsum(counts)[:-1]] = -steps[:-1]
+        np.cumsum(t, out=t)
+        increment = (delta / np.maximum(steps, 1)[:, None]).astype(np.float32)
+        start = start.astype(np.float32)
+        for axis, out in ((0, out_x), (1, out_y)):
+            coordinate = np.repeat(increment[:, axis], counts)
+            coordinate *= t
+            coordinate += np.repeat(start[:, axis], counts)
+            np.rint(coordinate, out=coordinate)
+            out[:total] = coordinate
+        if labels is not None:
+            out_labels[:total] = np.repeat(labels[keep], counts)
+        return total
+
+    def pixel_count(self, points, edges, vertex_radius):
+        # Upper bound on the pixels a frame lights, to size the scratch buffers
+        count = 0
+        if vertex_radius > 0:
+            count += len(points) * len(self.disk(vertex_radius))
+        if len(edges):
+            delta = np.abs(points[edges[:, 0]] - points[edges[:, 1]])
+            span = np.maximum(delta[:, 0], delta[:, 1])
+            count += int(np.minimum(span, self.width + self.height).sum()) + 2 * len(edges)
+        return count
+
+    def draw(self, points, edges, edge_color, vertex_color, vertex_radius):
+        # points: (V x 2) integer screen coordinates, edges: (E x 2) vertex indices
+        x, y = self.buffers(self.pixel_count(points, edges, vertex_radius))
+        count = 0
+        if len(edges):
+            count = self.edge_pixels(points, edges, x, y)
+        layers = [(x[:count], y[:count], edge_color)]
+        if vertex_radius > 0:
+            disk = self.disk(vertex_radius)
+            size = len(points) * len(disk)
+            # One axis at a time keeps the inner loop over the disk, not over (x, y)
+            for axis, out in ((0, x), (1, y)):
+                np.add(points[:, axis, None], disk[:, axis], casting="unsafe",
+                       out=out[count:count + size].reshape(len(points), len(disk)))
+            layers.append((x[count:count + size], y[count:count + size], vertex_color))
+        layers = [self._visible(*layer) for layer in layers]
+
+        if self.additive:
+            self._blend(layers)
+        else:
+            pixels = pygame.surfarray.pixels2d(self.surface)
+            # Dots come last, so they stay on top of the edges
+            for px, py, color in layers:
+                pixels[px, py] = self.surface.map_rgb(color)
+            del pixels  # unlocks the surface
+
+    def _visible(self, x, y, color):
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        if inside.all():
+            return x, y, color
+        return x[inside], y[inside], color
+
+    def _blend(self, layers):
+        # Each pixel gets its colour times the number of primitives covering it,
+        # added to what is already there and saturated at 255
+        layers = [layer for layer in layers if len(layer[0])]
+        if not layers:
+            return
+        left = min(int(px.min()) for px, py, color in layers)
+        top = min(int(py.min()) for px, py, color in layers)
+        height = max(int(py.max()) for px, py, color in layers) - top + 1
+        size = (max(int(px.max()) for px, py, color in layers) - left + 1) * height
+        keys = [(px - left) * height + (py - top) for px, py, color in layers]
+        if size <= 4 * sum(len(k) for k in keys):
+            # Dense figure: count hits over its bounding box
+            hits = [np.bincount(k, minlength=size) for k in keys]
+            lit = np.flatnonzero(np.logical_or.reduce(hits))
+            light = sum(h[lit, None] * np.asarray(color) for h, (px, py, color) in zip(hits, layers))
+        else:
+            # Sparse figure (a few lines in a large box): bin only the lit pixels
+            lit, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+            colors = np.repeat(np.array([color for px, py, color in layers]), [len(k) for k in keys], axis=0)
+            light = np.stack([np.bincount(inverse, colors[:, channel], len(lit)) for channel in range(3)],
+                             axis=1).astype(np.intp)
+
+        pixels = pygame.surfarray.pixels2d(self.surface)
+        px, py = lit // height + left, lit % height + top
+        current = pixels[px, py]
+        shifts = self.surface.get_shifts()[:3]
+        masks = self.surface.get_masks()[:3]
+        value = np.zeros_like(current)
+        for channel, (shift, mask) in enumerate(zip(shifts, masks)):
+            level = np.minimum(((current & mask) >> shift) + light[:, channel], 255)
+            value |= level.astype(current.dtype) << shift
+        pixels[px, py] = value
+        del pixels
@@ -0,0 +1,153 @@
+import pygame
+
+
+class Renderer:
+    # Draws a projected figure in a few batched calls and pushes only the parts
+    # of the screen that changed since the previous frame
+    def __init__(self, screen, background, display=True):
+        self.screen = screen
+        self.background = background
+        self.display = display  # False when drawing to an offscreen surface
+        self.bounds = screen.get_rect()
+        self.previous = None  # figure rect drawn last frame, None forces a full update
+        self.current = None
+        self.cleared = False  # previous was erased this frame
+        self.dirty = []
+        self._dots = {}
+        self._small = None  # (resolution, low-res buffer, scaled-up buffer)
+
+    def dot(self, color, radius):
+        # Pre-rendered vertex sprite, blitted instead of drawing a circle per vertex
+        key = (color, radius)
+        if key not in self._dots:
+            size = radius * 2 + 1
+            sprite = pygame.Surface((size, size))
+            sprite.set_colorkey((0, 0, 0))
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self._dots[key] = sprite
+        return self._dots[key]
+
+    def clear(self):
+        if self.previous is None:
+            self.screen.fill(self.background)
+        else:
+            self.screen.fill(self.background, self.previous)
+            self.cleared = True
+
+    def clear_area(self, rect):
+        # Something outside the figure changed (e.g. a slider), repaint and push it
+        self.screen.fill(self.background, rect)
+        self.dirty.append(rect)
+
+    def mark_dirty(self, rect):
+        self.dirty.append(rect)
+
+    def draw_figure(self, points, trails, edge_color, edge_width, vertex_color, vertex_radius,
+                    antialias=False, resolution=1.0):
+        # points: (V x 2) integer screen coordinates
+        area = self._bounds(points, max(vertex_radius, edge_width) + 1)
+        self._extend(area)
+        if resolution < 1 and area.width > 0 and area.height > 0:
+            self._draw_scaled(points, area, trails, edge_color, edge_width, vertex_color, vertex_radius, resolution)
+            return self.current
+
+        if vertex_radius > 0:
+            sprite = self.dot(vertex_color, vertex_radius)
+            corner = (points - vertex_radius).tolist()
+            self.screen.blits([(sprite, pos) for pos in corner], doreturn=False)
+
+        if antialias and edge_width == 1:
+            for trail in trails:
+                pygame.draw.aalines(self.screen, edge_color, False, points[trail].tolist())
+        else:
+            for trail in trails:
+                pygame.draw.lines(self.screen, edge_color, False, points[trail].tolist(), edge_width)
+        return self.current
+
+    def draw_pixels(self, rasterizer, points, edges, edge_color, vertex_color, vertex_radius):
+        # Same figure through the array rasterizer (raster.PixelRasterizer)
+        rasterizer.draw(points, edges, edge_color, vertex_color, vertex_radius)
+        self._extend(self._bounds(points, vertex_radius + 1))
+        return self.current
+
+    def draw_trails(self, trails, color):
+        # Fading afterimage (afterimage.MotionTrails), drawn before the figure
+        rect = trails.draw(color, self.background)
+        if rect is not None:
+            self._extend(rect)
+        return self.current
+
+    def _draw_scaled(self, points, area, trails, edge_color, edge_width, vertex_color, vertex_radius, resolution):
+        # Draw the figure's rect at a fraction of the resolution into a reused
+        # buffer, then scale it up over the screen (background keyed out, so
+        # faces already drawn underneath stay visible)
+        size = (max(1, int(area.width * resolution)), max(1, int(area.height * resolution)))
+        if self._small is None or self._small[0] != resolution:
+            full = (int(self.bounds.width * resolution) + 1, int(self.bounds.height * resolution) + 1)
+            self._small = (resolution, pygame.Surface(full), pygame.Surface(self.bounds.size))
+        small = self._small[1].subsurface((0, 0) + size)
+        large = self._small[2].subsurface((0, 0) + area.size)
+        small.fill(self.background)
+
+        local = ((points - area.topleft) * resolution).astype(points.dtype)
+        width = max(1, round(edge_width * resolution))
+        radius = round(vertex_radius * resolution)
+        if radius > 0:
+            sprite = self.dot(vertex_color, radius)
+            small.blits([(sprite, pos) for pos in (local - radius).tolist()], doreturn=False)
+        for trail in trails:
+            pygame.draw.lines(small, edge_color, False, local[trail].tolist(), width)
+
+        pygame.transform.scale(small, area.size, large)
+        large.set_colorkey(self.background)
+        self.screen.blit(large, area)
+
+    def touched(self):
+        # Every screen region repainted so far this frame
+        rects = [self.previous or self.bounds] + self.dirty
+        if self.current is not None:
+            rects.append(self.current)
+        return rects
+
+    def draw_faces(self, polygons, colors):
+        # polygons: (F x 4 x 2) screen points in drawing order, colors: (F x 3)
+        for polygon, color in zip(polygons.tolist(), colors.tolist()):
+            pygame.draw.polygon(self.screen, color, polygon)
+        if len(polygons):
+            self._extend(self._bounds(polygons.reshape(-1, 2), 1))
+        return self.current
+
+    def _extend(self, rect):
+        # Everything drawn this frame is cleared and pushed as one rect
+        self.current = rect if self.current is None else self.current.union(rect)
+
+    def _bounds(self, points, pad):
+        low = points.min(axis=0)
+        high = points.max(axis=0)
+        rect = pygame.Rect(int(low[0]) - pad, int(low[1]) - pad,
+                           int(high[0] - low[0]) + 2 * pad + 1, int(high[1] - low[1]) + 2 * pad + 1)
+        return rect.clip(self.bounds)
+
+    def flush(self):
+        # Regions of the surface that changed this frame; starts the next frame
+        if self.previous is None:
+            rects = [self.bounds]
+        else:
+            rects = self.dirty
+            if self.current is not None:
+                rects.append(self.previous.union(self.current))
+            elif self.cleared:
+                # Nothing drawn (e.g. the section missed the figure), but the
+                # erased figure still has to reach the display
+                rects.append(self.previous)
+        if self.current is not None or not self.cleared:
+            self.previous = self.current or self.bounds
+        self.current = None
+        self.cleared = False
+        self.dirty = []
+        return rects
+
+    def present(self):
+        rects = self.flush()
+        if self.display:
+            pygame.display.update(rects)
@@ -0,0 +1,52 @@
+import time
+
+
+class FrameScheduler:
+    # Simulation advances in fixed steps of real elapsed time, independent of
+    # how often frames are rendered. Rendering is paced to the target rate
+    # (sleeping or awaiting, never spinning) and skipped when it falls behind.
+    def __init__(self, fps=60, max_catch_up=0.25, max_skipped=4):
+        self.dt = 1 / fps
+        self.max_catch_up = max_catch_up  # seconds of simulation owed at most
+        self.max_skipped = max_skipped  # consecutive frames that may go undrawn
+        self.accumulator = 0.0
+        self.skipped = 0
+        now = time.perf_counter()
+        self.last = now
+        self.deadline = now
+
+    def steps(self):
+        # Whole simulation steps owed since the previous call
+        now = time.perf_counter()
+        self.accumulator += min(now - self.last, self.max_catch_up)
+        self.last = now
+        count = int(self.accumulator / self.dt)
+        self.accumulator -= count * self.dt
+        return count
+
+    def should_render(self):
+        # Drop this frame's drawing when already a full frame late
+        late = time.perf_counter() - self.deadline
+        if late > self.dt and self.skipped < self.max_skipped:
+            self.skipped += 1
+            return False
+        self.skipped = 0
+        return True
+
+    def delay(self):
+        # Seconds until the next frame is due
+        now = time.perf_counter()
+        self.deadline += self.dt
+        if self.deadline < now - self.dt:
+            # Far behind (e.g. the tab was hidden): re-sync instead of bursting
+            self.deadline = now
+        return max(0.0, self.deadline - now)
+
+    def wait(self):
+        time.sleep(self.delay())
+
+    async def wait_async(self):
+        # Yields to the browser event loop for the whole wait. asyncio is only
+        # imported here, so the desktop loop does not pay for it at startup
+        import asyncio
+        await asyncio.sleep(self.delay())
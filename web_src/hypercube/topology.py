@@ -0,0 +1,160 @@
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+# Vertex i of a D-cube has coordinate k = bit (D - 1 - k) of i, mapped to -1/+1.
+# Two vertices share an edge exactly when their indices differ in one bit, so
+# the whole topology can be built by flipping bits instead of comparing pairs.
+# Results are cached per dimension and returned read-only.
+
+
+def _frozen(array):
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=None)
+def vertices(dim):
+    index = np.arange(2 ** dim)
+    shifts = np.arange(dim - 1, -1, -1)
+    return _frozen(((index[:, None] >> shifts) & 1) * 2.0 - 1.0)
+
+
+def _spans(dim, k):
+    # Every k-dimensional face: choose k free bits, then every base vertex
+    # with those bits cleared. Returns (base indices, free bit masks).
+    index = np.arange(2 ** dim)
+    bases = []
+    masks = []
+    for free in combinations(range(dim), k):
+        mask = sum(1 << b for b in free)
+        base = index[(index & mask) == 0]
+        bases.append(base)
+        masks.append(np.broadcast_to([1 << b for b in free], (len(base), k)))
+    if not bases:
+        return np.zeros(0, dtype=np.intp), np.zeros((0, k), dtype=np.intp)
+    return np.concatenate(bases), np.concatenate(masks)
+
+
+@lru_cache(maxsize=None)
+def edges(dim):
+    # (E x 2) vertex indices, E = D * 2^(D-1)
+    base, bits = _spans(dim, 1)
+    return _frozen(np.stack([base, base | bits[:, 0]], axis=1))
+
+
+@lru_cache(maxsize=None)
+def faces(dim):
+    # (F x 4) square faces, vertices in cyclic order around the square
+    base, bits = _spans(dim, 2)
+    a = bits[:, 0]
+    b = bits[:, 1]
+    return _frozen(np.stack([base, base | a, base | a | b, base | b], axis=1))
+
+
+@lru_cache(maxsize=None)
+def cells(dim):
+    # (C x 8) cubic cells, vertices ordered like the corners of a 3-cube
+    base, bits = _spans(dim, 3)
+    corners = np.arange(8)
+    offsets = np.zeros((len(base), 8), dtype=np.intp)
+    for j in range(3):
+        offsets |= ((corners >> (2 - j)) & 1) * bits[:, j:j + 1]
+    return _frozen(base[:, None] | offsets)
+
+
+@lru_cache(maxsize=None)
+def face_edges(dim):
+    # (F x 4) indices into edges(dim) of each square's sides, in cyclic order
+    # (side j joins corners j and j + 1 of faces(dim))
+    square = faces(dim)
+    ends = np.stack([square, np.roll(square, -1, axis=1)], axis=2)
+    count = 2 ** dim
+    keys = ends.min(axis=2) * count + ends.max(axis=2)
+    edge_keys = edges(dim).min(axis=1) * count + edges(dim).max(axis=1)
+    order = np.argsort(edge_keys)
+    return _frozen(order[np.searchsorted(edge_keys, keys, sorter=order)])
+
+
+# The six faces of a 3-cube as cyclic quads of its corner indices (see cells)
+CELL_QUADS = np.array([
+    [0, 1, 3, 2], [4, 5, 7, 6],
+    [0, 1, 5, 4], [2, 3, 7, 6],
+    [0, 2, 6, 4], [1, 3, 7, 5],
+])
+
+
+@lru_cache(maxsize=None)
+def cell_faces(dim):
+    # Faces of every cell, (C*6 x 4) quads, and the cell each one bounds. A
+    # square shared by two cells appears once per cell, so each copy can be
+    # culled against its own cell.
+    quads = cells(dim)[:, CELL_QUADS].reshape(-1, 4)
+    owner = np.repeat(np.arange(len(cells(dim))), 6)
+    return _frozen(quads), _frozen(owner)
+
+
+def edge_trails(edges, vertex_count):
+    # Cover every edge with as few polylines as possible so each can be drawn
+    # with one pygame.draw.lines call. Odd-degree vertices are paired through a
+    # virtual vertex; an Euler circuit is then cut wherever it passes through it.
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    degree = np.bincount(edges.ravel(), minlength=vertex_count)
+    virtual = vertex_count
+    odd = np.flatnonzero(degree % 2)
+    pairs = np.concatenate([edges, np.stack([np.full(len(odd), virtual), odd], axis=1)])
+
+    # Adjacency in CSR form: neighbours of v are neighbour[offset[v]:offset[v + 1]]
+    ends = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    order = np.argsort(ends, kind="stable")
+    neighbour = np.concatenate([pairs[:, 1], pairs[:, 0]])[order].tolist()
+    edge_ids = np.concatenate([np.arange(len(pairs))] * 2)[order].tolist()
+    offset = np.concatenate([[0], np.cumsum(np.bincount(ends, minlength=vertex_count + 1))])
+    cursor = offset[:-1].tolist()
+    stop = offset[1:].tolist()
+    used = bytearray(len(pairs))
+
+    trails = []
+    starts = [virtual] if len(odd) else []
+    starts += np.flatnonzero(degree).tolist()
+    for start in starts:
+        if cursor[start] == stop[start]:
+            continue
+        # Iterative Hierholzer
+        stack = [start]
+        circuit = []
+        while stack:
+            v = stack[-1]
+            i = cursor[v]
+            while i < stop[v] and used[edge_ids[i]]:
+                i += 1
+            cursor[v] = i
+            if i < stop[v]:
+                used[edge_ids[i]] = 1
+                stack.append(neighbour[i])
+            else:
+                circuit.append(stack.pop())
+
+        trail = []
+        for v in circuit:
+            if v == virtual:
+                if len(trail) > 1:
+                    trails.append(np.array(trail, dtype=np.intp))
+                trail = []
+            else:
+                trail.append(v)
+        if len(trail) > 1:
+            trails.append(np.array(trail, dtype=np.intp))
+    return trails
+
+
+@lru_cache(maxsize=None)
+def trails(dim):
+    # Edge trails of the D-cube. Every vertex has degree D, so for odd D the
+    # edges along the lowest bit are walked twice; redrawing a line is
+    # invisible and keeps the whole figure a single closed polyline.
+    cube_edges = edges(dim)
+    if dim % 2:
+        cube_edges = np.concatenate([cube_edges, cube_edges[:2 ** (dim - 1)]])
+    return tuple(_frozen(trail) for trail in edge_trails(cube_edges, 2 ** dim))
@@ -0,0 +1,37 @@
+import math
+from itertools import combinations
+
+import numpy as np
+
+
+def all_planes(dim):
+    # Every rotation plane of a D-dimensional space, D * (D - 1) / 2 of them
+    return list(combinations(range(dim), 2))
+
+
+class Transform:
+    def __init__(self, dim, planes):
+        self.dim = dim
+        self.planes = list(planes)
+        self._matrix = np.empty((dim, dim))
+
+    def matrix(self, angles):
+        # One cos/sin per plane for the whole frame
+        rows = [[1.0 if i == j else 0.0 for j in range(self.dim)] for i in range(self.dim)]
+
+        # Left-multiplying by a plane rotation only mixes rows a and b, so the
+        # planes are folded in one after another without full matrix products.
+        # The matrices are tiny, so plain floats beat NumPy call overhead here.
+        for (a, b), angle in zip(self.planes, angles):
+            c = math.cos(angle)
+            s = math.sin(angle)
+            row_a = rows[a]
+            row_b = rows[b]
+            rows[a] = [c * x - s * y for x, y in zip(row_a, row_b)]
+            rows[b] = [s * x + c * y for x, y in zip(row_a, row_b)]
+        self._matrix[:] = rows
+        return self._matrix
+
+    def apply(self, points, matrix, out=None):
+        # Row vectors, so p' = M p for every vertex with a single product
+        return np.matmul(points, matrix.T, out=out)
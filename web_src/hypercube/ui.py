@@ -0,0 +1,150 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class Slider:
+    def __init__(self, x, y, w, h, min_val, max_val, initial_val, text, reset_val=None, decimals=3):
+        self.rect = pygame.Rect(x, y, w, h)
+        # Position reset button to the right of the slider (None: no button)
+        self.reset_rect = pygame.Rect(x + w + 10, y - 5, 40, 20) if reset_val is not None else None
+        # Everything the slider paints: label above, knob overhanging the track
+        self.area = pygame.Rect(x - 5, y - 25, w + 10, h + 30)
+        if self.reset_rect:
+            self.area.union_ip(self.reset_rect)
+        self.min_val = min_val
+        self.max_val = max_val
+        self.val = initial_val
+        self.reset_val = reset_val
+        self.text = text
+        self.decimals = decimals
+        self.dragging = False
+
+    def label(self):
+        return f"{self.text}: {self.val:.{self.decimals}f}"
+
+    def knob_rect(self, padding=5):
+        val_norm = (self.val - self.min_val) / (self.max_val - self.min_val)
+        knob_x = self.rect.x + val_norm * self.rect.width
+        return pygame.Rect(knob_x - padding, self.rect.y - padding, padding * 2, self.rect.height + padding * 2)
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                mouse_pos = event.pos
+
+                # Check reset button click
+                if self.reset_rect and self.reset_rect.collidepoint(mouse_pos):
+                    self.val = self.reset_val
+                    return
+
+                # Check slider click (slight padding for easier grab)
+                if self.knob_rect(10).collidepoint(mouse_pos) or self.rect.collidepoint(mouse_pos):
+                    self.dragging = True
+                    self.update_val(mouse_pos[0])
+
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:
+                self.dragging = False
+
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                self.update_val(event.pos[0])
+
+    def update_val(self, mouse_x):
+        # Clamp mouse_x to slider rect
+        x = max(self.rect.x, min(mouse_x, self.rect.right))
+        norm = (x - self.rect.x) / self.rect.width
+        self.val = self.min_val + norm * (self.max_val - self.min_val)
+
+
+class LabelCache:
+    # Bounded LRU of rendered text surfaces, keyed by the formatted string
+    def __init__(self, font, color, maxsize=256):
+        self.font = font
+        self.color = color
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+
+    def get(self, text):
+        surface = self._surfaces.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, self.color)
+            self._surfaces[text] = surface
+            if len(self._surfaces) > self.maxsize:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(text)
+        return surface
+
+
+class SliderPanel:
+    # Retained-mode slider UI: tracks and reset buttons are painted once onto
+    # a static surface, and a slider is recomposited only when it changes.
+    # Pixels left in the background color are transparent when blitted, so
+    # the figure still shows between the sliders.
+    def __init__(self, sliders, background):
+        self.sliders = sliders
+        self.background = background
+        self.font = pygame.font.Font(None, 24)
+        self.labels = LabelCache(self.font, (255, 255, 255))
+
+        self.rect = sliders[0].area.unionall([s.area for s in sliders[1:]])
+        self.static = pygame.Surface(self.rect.size)
+        self.static.fill(background)
+        for slider in sliders:
+            pygame.draw.rect(self.static, (100, 100, 100), self.local(slider.rect))
+            if slider.reset_rect:
+                reset_rect = self.local(slider.reset_rect)
+                pygame.draw.rect(self.static, (150, 50, 50), reset_rect)
+                reset_label = self.font.render("R", True, (255, 255, 255))
+                self.static.blit(reset_label, reset_label.get_rect(center=reset_rect.center))
+
+        self.surface = self.static.copy()
+        self.surface.set_colorkey(background)
+        self.state = {}
+        self.active = None
+
+    def local(self, rect):
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def handle_event(self, event):
+        # Route mouse input to the slider being dragged or the one under the cursor
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for slider in self.sliders:
+                # The grab zone around the knob reaches past the painted area
+                if slider.area.union(slider.knob_rect(10)).collidepoint(event.pos):
+                    slider.handle_event(event)
+                    if slider.dragging:
+                        self.active = slider
+                    break
+        elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
+            if self.active is not None:
+                self.active.handle_event(event)
+                if not self.active.dragging:
+                    self.active = None
+
+    def update(self):
+        # Recomposite changed sliders; returns their screen areas
+        changed = []
+        for slider in self.sliders:
+            state = (slider.val, slider.dragging)
+            if self.state.get(slider) == state:
+                continue
+            self.state[slider] = state
+
+            area = self.local(slider.area)
+            self.surface.blit(self.static, area, area)
+            label = self.labels.get(slider.label())
+            self.surface.blit(label, (area.x + 5, area.y))
+            color = (200, 200, 200) if not slider.dragging else (255, 255, 255)
+            pygame.draw.rect(self.surface, color, self.local(slider.knob_rect()))
+            changed.append(slider.area)
+        return changed
+
+    def draw(self, screen, rects):
+        # Blit the panel only where the screen was repainted this frame
+        for rect in rects:
+            clip = rect.clip(self.rect)
+            if clip.width and clip.height:
+                screen.blit(self.surface, clip, self.local(clip))